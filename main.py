@@ -7,7 +7,6 @@ Uses clean architecture with proper separation of concerns.
 
 import sys
 import argparse
-from src.core.orchestrator import ApplicationOrchestrator
 
 
 def create_parser():
@@ -63,6 +62,9 @@ def main():
     parser = create_parser()
     args = parser.parse_args()
     
+    # Imported after parsing so --help and argument errors skip the service imports
+    from src.core.orchestrator import ApplicationOrchestrator
+    
     # Handle interactive mode or specific commands
     if args.interactive or args.command == 'interactive':
         app = ApplicationOrchestrator(config_path=args.config)
@@ -5,31 +5,231 @@ This module provides a clean, maintainable service for classifying
 thesis abstracts using AI.
 """
 
+import hashlib
 import json
 import os
+import random
+import re
+import sqlite3
+import threading
 import time
-from typing import Dict, Any, List
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 
 from ..core.abstractions import IClassificationService, ClassificationResult, ProcessingResult, ProcessingStatus, ClassificationError
-from ..core.utils import FileNameExtractor, FileNameGenerator, PathManager, PerformanceTimer
+from ..core.utils import FileNameExtractor, FileNameGenerator, PathManager, PerformanceTimer, dump_json_bytes, get_console, iter_thesis_records, parse_json, parse_json_object_prefix
 from ..config.service import ApplicationConfig
 
+# Markdown code fence the model sometimes wraps its JSON in despite the instructions
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
 
-@dataclass
+# Server-suggested wait in Gemini quota errors ("retry in 37.5s" / "retry_delay { seconds: 37 }")
+_RETRY_DELAY_RE = re.compile(r"retry(?:_delay\s*\{\s*seconds:\s*| in )(\d+(?:\.\d+)?)")
+
+# Placeholder the repository shows instead of an abstract; searched without upper-casing a copy
+_FULL_TEXT_PLACEHOLDER_RE = re.compile(r"LIHAT DI FULL TEXT", re.IGNORECASE)
+
+
+@dataclass(slots=True)
 class ThesisItem:
-    """Container for thesis classification data."""
+    """Container for thesis classification data (slotted; one exists per pending thesis)."""
     id: str
     title: str
     abstract: str
     original_data: Dict[str, Any]
+    
+    @property
+    def estimated_tokens(self) -> int:
+        """Rough prompt tokens for this item: ~4 characters per token plus JSON/id overhead."""
+        return -(-(len(self.title) + len(self.abstract)) // 4) + 40
+
+
+class RateLimiter:
+    """
+    Sliding one-minute window over requests and tokens, shared across threads.
+    
+    acquire() blocks until a request of the given size fits the per-minute
+    budgets, so concurrent batches wait up front instead of hitting 429s.
+    If the API rate-limits anyway, pause() holds back every caller, and once
+    the pause ends a single probe request must finish before the rest resume.
+    """
+    
+    WINDOW_SECONDS = 60.0
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            requests_per_minute: Request budget per minute (0 for unlimited)
+            tokens_per_minute: Token budget per minute (0 for unlimited)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._lock = threading.Lock()
+        self._requests: deque = deque()  # timestamps
+        self._tokens: deque = deque()  # (timestamp, tokens)
+        self._token_total = 0
+        self._paused_until = 0.0
+        self._probe_needed = False
+        self._probe_in_flight = False
+    
+    def _expire(self, now: float) -> None:
+        """Drop window entries older than a minute (caller holds the lock)."""
+        while self._requests and now - self._requests[0] >= self.WINDOW_SECONDS:
+            self._requests.popleft()
+        while self._tokens and now - self._tokens[0][0] >= self.WINDOW_SECONDS:
+            self._token_total -= self._tokens.popleft()[1]
+    
+    def acquire(self, tokens: int) -> bool:
+        """
+        Wait until a request using the given number of tokens fits the budgets.
+        
+        Args:
+            tokens: Estimated tokens the request will use
+            
+        Returns:
+            True if this request is the probe after a pause; the caller must
+            call end_probe() once it completes
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._expire(now)
+                
+                fits_requests = not self.requests_per_minute or len(self._requests) < self.requests_per_minute
+                # A request larger than the whole budget still goes through on an empty window
+                fits_tokens = (not self.tokens_per_minute or not self._tokens
+                               or self._token_total + tokens <= self.tokens_per_minute)
+                
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._probe_in_flight:
+                    wait = 0.1  # Released by end_probe()
+                elif fits_requests and fits_tokens:
+                    self._requests.append(now)
+                    self._tokens.append((now, tokens))
+                    self._token_total += tokens
+                    is_probe, self._probe_needed = self._probe_needed, False
+                    self._probe_in_flight = is_probe
+                    return is_probe
+                else:
+                    # Sleep until the oldest entry blocking us leaves the window
+                    oldest = self._requests[0] if not fits_requests else self._tokens[0][0]
+                    wait = self.WINDOW_SECONDS - (now - oldest)
+            time.sleep(max(wait, 0.05))
+    
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """
+        Correct the token window with a request's reported usage.
+        
+        Args:
+            estimated_tokens: Tokens passed to acquire() for the request
+            actual_tokens: Tokens the API reported for it
+        """
+        with self._lock:
+            correction = actual_tokens - estimated_tokens
+            self._tokens.append((time.monotonic(), correction))
+            self._token_total += correction
+    
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back all requests after the API reported rate limiting.
+        
+        Args:
+            seconds: How long to wait before probing again
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._probe_needed = True
+    
+    def end_probe(self) -> None:
+        """Let waiting requests through once the probe request has completed."""
+        with self._lock:
+            self._probe_in_flight = False
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD limit on concurrent API calls.
+    
+    The limit starts at 1 and grows by ALPHA after each call that finishes
+    within LATENCY_TARGET seconds. It shrinks by a factor of BETA only when
+    the API signals overload (rate limiting, timeouts, unavailability), and
+    stays between 1 and the configured maximum.
+    """
+    
+    ALPHA = 0.5
+    BETA = 0.7
+    LATENCY_TARGET = 30.0
+    
+    # Errors that mean the API is overloaded; anything else says nothing about load
+    OVERLOAD_ERRORS = (
+        google_exceptions.TooManyRequests,
+        google_exceptions.ResourceExhausted,
+        google_exceptions.DeadlineExceeded,
+        google_exceptions.ServiceUnavailable,
+        TimeoutError,
+    )
+    
+    def __init__(self, maximum: int):
+        """
+        Initialize adaptive concurrency.
+        
+        Args:
+            maximum: Upper bound for concurrent calls
+        """
+        self.maximum = maximum
+        self.limit = 1.0
+        self._active = 0
+        self._condition = threading.Condition()
+    
+    @contextmanager
+    def slot(self):
+        """Hold one call slot, waiting while the current limit is reached."""
+        with self._condition:
+            while self._active >= int(self.limit):
+                self._condition.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+    
+    def record_success(self, latency: float) -> None:
+        """Additively raise the limit after a call that finished within the latency target."""
+        if latency >= self.LATENCY_TARGET:
+            return
+        with self._condition:
+            self.limit = min(float(self.maximum), self.limit + self.ALPHA)
+            self._condition.notify_all()
+    
+    def record_failure(self, error: BaseException) -> None:
+        """Multiplicatively lower the limit after a call failed because the API is overloaded."""
+        if not isinstance(error, self.OVERLOAD_ERRORS):
+            return
+        with self._condition:
+            self.limit = max(1.0, self.limit * self.BETA)
 
 
 class ClassificationService(IClassificationService):
     """Service for AI-powered thesis classification."""
     
+    # Rough response size per thesis, added to the prompt estimate before a call
+    EXPECTED_OUTPUT_TOKENS_PER_ITEM = 30
+    
+    # With compact_prompts, share of later calls that still carry the descriptions
+    FULL_PROMPT_SAMPLE_RATE = 0.1
+    
     def __init__(self, config: ApplicationConfig):
         """
         Initialize classification service.
@@ -40,6 +240,12 @@ class ClassificationService(IClassificationService):
         self.config = config
         self._configure_api()
         self.model = genai.GenerativeModel(config.api.gemini_model)
+        self.rate_limiter = RateLimiter(
+            config.classification.requests_per_minute,
+            config.classification.tokens_per_minute
+        )
+        self.concurrency = AdaptiveConcurrency(config.classification.max_concurrent_batches)
+        self._descriptions_sent = False
     
     def _configure_api(self) -> None:
         """Configure the Gemini API."""
@@ -79,6 +285,18 @@ class ClassificationService(IClassificationService):
         if not theses:
             return []
         
+        # Identical theses (e.g. the same entry listed under two years) are
+        # sent once and share the result
+        unique_positions: Dict[Tuple[str, str], int] = {}
+        positions = [
+            unique_positions.setdefault((thesis.get("title", ""), thesis.get("abstract", "")), len(unique_positions))
+            for thesis in theses
+        ]
+        if len(unique_positions) < len(theses):
+            unique_theses = [{"title": title, "abstract": abstract} for title, abstract in unique_positions]
+            unique_results = self.classify_batch(unique_theses)
+            return [unique_results[position] for position in positions]
+        
         # Prepare batch for API
         batch_items = []
         for i, thesis in enumerate(theses):
@@ -88,19 +306,50 @@ class ClassificationService(IClassificationService):
                 "abstract": thesis.get("abstract", "")
             })
         
+        # Valid names map to the configured strings themselves, so every result
+        # shares one object per category instead of a copy from each response
+        known_categories = {name: name for name in self.config.classification.categories}
+        
         # Generate prompt and call API
-        prompt = self._generate_classification_prompt(batch_items)
+        include_descriptions = (not self.config.classification.compact_prompts or not self._descriptions_sent
+                                or random.random() < self.FULL_PROMPT_SAMPLE_RATE)
+        prompt = self._generate_classification_prompt(batch_items, include_descriptions)
+        # ~4 characters per token for the prompt, plus the expected JSON reply
+        estimated_tokens = len(prompt) // 4 + self.EXPECTED_OUTPUT_TOKENS_PER_ITEM * len(theses)
         
         for attempt in range(self.config.classification.retries):
             try:
-                response = self.model.generate_content(prompt)
+                with self.concurrency.slot():
+                    # Reserve the rate-limit slot only once the call can go out, so
+                    # reservations don't expire unused while waiting for concurrency
+                    is_probe = self.rate_limiter.acquire(estimated_tokens)
+                    try:
+                        # Streamed, so a response that stops early fails fast
+                        # and the text it did produce is still available
+                        started = time.monotonic()
+                        response = self.model.generate_content(prompt, stream=True)
+                        response_text = "".join(self._chunk_text(chunk) for chunk in response)
+                        latency = time.monotonic() - started
+                    except Exception as e:
+                        self.concurrency.record_failure(e)
+                        if isinstance(e, google_exceptions.TooManyRequests):
+                            # Every worker waits this out, not just this one
+                            self.rate_limiter.pause(self._retry_after(e) or self._retry_delay(attempt))
+                        raise
+                    finally:
+                        if is_probe:
+                            self.rate_limiter.end_probe()
+                self.concurrency.record_success(latency)
                 
-                if not response.text:
+                usage = getattr(response, 'usage_metadata', None)
+                if usage is not None and getattr(usage, 'total_token_count', 0):
+                    self.rate_limiter.record_usage(estimated_tokens, usage.total_token_count)
+                
+                if not response_text:
                     raise ValueError("API returned empty response")
                 
-                # Parse response
-                cleaned_text = response.text.strip().replace("```json", "").replace("```", "").strip()
-                classifications = json.loads(cleaned_text)
+                classifications, truncated = self._parse_response(response_text)
+                self._descriptions_sent = self._descriptions_sent or include_descriptions
                 
                 # Convert to results
                 results = []
@@ -109,18 +358,28 @@ class ClassificationService(IClassificationService):
                     classification = classifications.get(item_id, {})
                     
                     if isinstance(classification, dict):
-                        primary = classification.get("primary", "Classification Failed")
-                        secondary = classification.get("secondary", "Classification Failed")
-                        
                         # Validate categories
-                        if (primary in self.config.classification.categories and 
-                            secondary in self.config.classification.categories):
+                        primary = known_categories.get(classification.get("primary"))
+                        secondary = known_categories.get(classification.get("secondary"))
+                        if primary is not None and secondary is not None:
                             results.append(ClassificationResult(primary, secondary))
                         else:
                             results.append(ClassificationResult("Classification Failed", "Classification Failed"))
                     else:
                         results.append(ClassificationResult("Classification Failed", "Classification Failed"))
                 
+                # Items lost to truncation go out again as a smaller batch
+                if truncated:
+                    missing = [i for i in range(len(theses)) if f"item_{i}" not in classifications]
+                    if len(missing) == len(theses):
+                        # Nothing usable was salvaged; retrying the same batch is the only option
+                        raise ValueError("Truncated response contained no answered items")
+                    if missing:
+                        if self.config.verbose_logging:
+                            print(f"    - Warning: response truncated, retrying {len(missing)} unanswered items")
+                        for i, result in zip(missing, self.classify_batch([theses[i] for i in missing])):
+                            results[i] = result
+                
                 return results
                 
             except (json.JSONDecodeError, ValueError) as e:
@@ -128,7 +387,7 @@ class ClassificationService(IClassificationService):
                     print(f"    - Warning: API call failed on attempt {attempt + 1}: {e}")
                 
                 if attempt < self.config.classification.retries - 1:
-                    time.sleep(5)
+                    time.sleep(self._retry_delay(attempt))
                 else:
                     # Return failed results for all items
                     return [ClassificationResult("Classification Failed", "Classification Failed") for _ in theses]
@@ -138,35 +397,83 @@ class ClassificationService(IClassificationService):
                     print(f"    - Unexpected error on attempt {attempt + 1}: {e}")
                 
                 if attempt < self.config.classification.retries - 1:
-                    time.sleep(5)
+                    time.sleep(self._retry_delay(attempt))
                 else:
-                    return [ClassificationResult("Classification Failed", "Classification Failed") for _ in theses]
+                    # API/transport errors say nothing about the theses themselves
+                    return [ClassificationResult("Classification Failed", "Classification Failed", transient=True)
+                            for _ in theses]
         
-        return [ClassificationResult("Classification Failed", "Classification Failed") for _ in theses]
+        return [ClassificationResult("Classification Failed", "Classification Failed", transient=True) for _ in theses]
     
-    def _generate_classification_prompt(self, batch_items: List[Dict[str, Any]]) -> str:
-        """Generate prompt for classification API call."""
-        categories = self.config.classification.categories
-        category_list_str = "\n".join([f"- **{cat}**: {desc}" for cat, desc in categories.items()])
-        items_to_classify_str = json.dumps(batch_items, indent=2, ensure_ascii=False)
+    @staticmethod
+    def _chunk_text(chunk: Any) -> str:
+        """Get a streamed chunk's text; a chunk without parts (e.g. a final MAX_TOKENS or SAFETY one) has none."""
+        try:
+            return chunk.text
+        except ValueError:
+            return ""
+    
+    @staticmethod
+    def _parse_response(text: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Parse the model's JSON reply.
         
-        prompt = f'''
+        Returns:
+            Tuple of (classifications by item id, whether the reply was cut
+            off and only its complete items were recovered)
+            
+        Raises:
+            json.JSONDecodeError: If no complete item can be recovered
+        """
+        # Only strip code fences if the bare text isn't JSON
+        try:
+            return parse_json(text), False
+        except json.JSONDecodeError:
+            text = _FENCE_RE.sub("", text)
+        try:
+            return parse_json(text), False
+        except json.JSONDecodeError:
+            # A reply cut off at the output token limit still holds complete items
+            classifications = parse_json_object_prefix(text)
+            if not classifications:
+                raise
+            return classifications, True
+    
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """Get the wait the server suggested in a quota error, if any."""
+        match = _RETRY_DELAY_RE.search(str(error))
+        return float(match.group(1)) if match else None
+    
+    @staticmethod
+    def _retry_delay(attempt: int) -> float:
+        """Exponential backoff with jitter, capped at a minute."""
+        return min(60.0, 2 ** attempt + random.random())
+    
+    def _generate_classification_prompt(self, batch_items: List[Dict[str, Any]],
+                                        include_descriptions: bool = True) -> str:
+        """Generate prompt for classification API call."""
+        prefix = _build_prompt_prefix(tuple(self.config.classification.categories.items()), include_descriptions)
+        # Compact JSON: the model doesn't need the indentation, and it costs tokens
+        return prefix + dump_json_bytes(batch_items, indent=False).decode('utf-8') + "\n"
+
+
+# Everything but the research items, so the prompt starts with an identical
+# prefix on every batch (cheaper to build and reusable by provider-side caching)
+_PROMPT_PREFIX_TEMPLATE = '''
 You are an expert academic classifier. Your task is to classify each research item into categories based on its title and abstract.
 
-**Categories and Descriptions:**
-{category_list_str}
+**{category_heading}:**
+{category_list}
 
 **Instructions:**
-1. Analyze the title and abstract for each item in the JSON array below.
+1. Analyze the title and abstract for each item in the JSON array at the end of this prompt.
 2. For each item, determine the PRIMARY focus (most dominant theme) and SECONDARY focus (secondary theme, can be same as primary).
 3. Your response MUST be a valid JSON object that maps each 'id' to an object with 'primary' and 'secondary' fields.
-4. Both category names MUST be one of these exact strings: {", ".join(categories.keys())}.
+4. Both category names MUST be one of these exact strings: {category_names}.
 5. The secondary focus can be the same as primary if the thesis has only one main focus.
 6. Do NOT include any explanations, comments, or markdown formatting (like ```json) in your response.
 
-**Research Items to Classify:**
-{items_to_classify_str}
-
 **Required Output Format (JSON object):**
 {{
   "id_1": {{
@@ -179,8 +486,284 @@ You are an expert academic classifier. Your task is to classify each research it
   }},
   ...
 }}
+
+**Research Items to Classify:**
 '''
-        return prompt
+
+
+@lru_cache(maxsize=8)
+def _build_prompt_prefix(categories: Tuple[Tuple[str, str], ...], include_descriptions: bool = True) -> str:
+    """Render the fixed part of the classification prompt for a set of categories."""
+    if include_descriptions:
+        category_list = "\n".join(f"- **{cat}**: {desc}" for cat, desc in categories)
+    else:
+        category_list = "\n".join(f"- **{cat}**" for cat, _ in categories)
+    return _PROMPT_PREFIX_TEMPLATE.format(
+        category_heading="Categories and Descriptions" if include_descriptions else "Categories",
+        category_list=category_list,
+        category_names=", ".join(cat for cat, _ in categories)
+    )
+
+
+def _classification_fingerprint(model_name: str, categories: Dict[str, str]) -> str:
+    """Short hash identifying the model and categories that produced a classification."""
+    fingerprint = json.dumps([model_name, sorted(categories.items())], ensure_ascii=False)
+    return hashlib.blake2b(fingerprint.encode('utf-8'), digest_size=8).hexdigest()
+
+
+class ClassificationCache:
+    """
+    Exact-match cache of (title, abstract) classifications, persisted in SQLite.
+    
+    Keys include the model name and the category definitions, so changing
+    either starts from an empty cache. The cache is best-effort: if the
+    database cannot be opened, lookups simply miss.
+    
+    Failures are cached too: a thesis whose model output was unusable in
+    FAILURE_LIMIT runs is not sent again until FAILURE_COOLDOWN seconds after
+    its last failure. Rate limits and other API errors are not counted.
+    """
+    
+    CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "unhas_scraper", "classifications.sqlite")
+    FAILURE_LIMIT = 3
+    FAILURE_COOLDOWN = 24 * 60 * 60
+    
+    def __init__(self, model_name: str, categories: Dict[str, str], path: str = CACHE_PATH):
+        """
+        Initialize classification cache.
+        
+        Args:
+            model_name: Gemini model producing the classifications
+            categories: Category names and descriptions used in the prompt
+            path: SQLite database location
+        """
+        self._version = _classification_fingerprint(model_name, categories)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Shared by the batch worker threads; access is serialized by _lock
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, primary_cat TEXT, secondary_cat TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS failures (key TEXT PRIMARY KEY, attempts INTEGER, failed_at REAL)"
+            )
+        except (OSError, sqlite3.Error):
+            self._conn = None
+    
+    def _key(self, title: str, abstract: str) -> str:
+        """Build the cache key for a thesis under the current model and categories."""
+        material = f"{title}\x00{abstract}\x00{self._version}"
+        return hashlib.blake2b(material.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def get(self, title: str, abstract: str) -> Optional[Tuple[str, str]]:
+        """
+        Look up a cached classification.
+        
+        Returns:
+            Tuple of (primary, secondary) categories, or None on a miss
+        """
+        if self._conn is None:
+            return None
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT primary_cat, secondary_cat FROM cache WHERE key = ?", (self._key(title, abstract),)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        return (row[0], row[1]) if row else None
+    
+    def put_many(self, entries: Sequence[Tuple[str, str, str, str]]) -> None:
+        """
+        Store successful classifications.
+        
+        Args:
+            entries: (title, abstract, primary, secondary) tuples
+        """
+        if self._conn is None or not entries:
+            return
+        rows = [(self._key(title, abstract), primary, secondary) for title, abstract, primary, secondary in entries]
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.executemany("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", rows)
+                    self._conn.executemany("DELETE FROM failures WHERE key = ?", [(row[0],) for row in rows])
+            except sqlite3.Error:
+                pass  # Caching is an optimization; a failed write only costs a future API call
+    
+    def is_suppressed(self, title: str, abstract: str) -> bool:
+        """Check whether a thesis failed too often, too recently, to try again."""
+        if self._conn is None:
+            return False
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT attempts, failed_at FROM failures WHERE key = ?", (self._key(title, abstract),)
+                ).fetchone()
+            except sqlite3.Error:
+                return False
+        return bool(row) and row[0] >= self.FAILURE_LIMIT and time.time() - row[1] < self.FAILURE_COOLDOWN
+    
+    def record_failures(self, entries: Sequence[Tuple[str, str]]) -> None:
+        """
+        Count a failed classification (unusable model output, not an API error) for each thesis.
+        
+        Args:
+            entries: (title, abstract) tuples
+        """
+        if self._conn is None or not entries:
+            return
+        now = time.time()
+        rows = [(self._key(title, abstract), now) for title, abstract in entries]
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT INTO failures VALUES (?, 1, ?) ON CONFLICT(key) DO UPDATE "
+                        "SET attempts = attempts + 1, failed_at = excluded.failed_at",
+                        rows
+                    )
+            except sqlite3.Error:
+                pass
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+                self._conn = None
+
+
+class SemanticClassificationCache:
+    """
+    Reuses classifications of near-duplicate theses found by embedding similarity.
+    
+    Theses sharing boilerplate abstracts are embedded with a multilingual
+    sentence-transformer and looked up in a FAISS inner-product index; a
+    neighbour above the similarity threshold lends its labels instead of
+    another API call. Requires the optional ``semantic`` dependencies.
+    """
+    
+    EMBEDDING_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+    CHECKPOINT_BATCHES = 5
+    CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "unhas_scraper", "semantic")
+    
+    def __init__(self, model_name: str, categories: Dict[str, str], threshold: float):
+        """
+        Initialize semantic cache, loading any index saved by earlier runs.
+        
+        Args:
+            model_name: Gemini model producing the classifications
+            categories: Category names and descriptions used in the prompt
+            threshold: Minimum cosine similarity for reusing a classification
+            
+        Raises:
+            ImportError: If sentence-transformers or faiss is not installed
+        """
+        # Imported here because they pull in torch, which takes seconds to load
+        import faiss
+        from sentence_transformers import SentenceTransformer
+        
+        self._faiss = faiss
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._model = SentenceTransformer(self.EMBEDDING_MODEL)
+        
+        base = os.path.join(self.CACHE_DIR, _classification_fingerprint(model_name, categories))
+        self._index_path = f"{base}.faiss"
+        self._labels_path = f"{base}.json"
+        self._unsaved_batches = 0
+        # One thread, so snapshots are written in the order they were taken
+        self._writer = ThreadPoolExecutor(max_workers=1)
+        
+        try:
+            self._index = faiss.read_index(self._index_path)
+            with open(self._labels_path, 'rb') as f:
+                self._labels: List[List[str]] = parse_json(f.read())
+            if self._index.ntotal != len(self._labels):
+                raise ValueError("index and labels are out of sync")
+        except (OSError, RuntimeError, ValueError):
+            self._index = faiss.IndexFlatIP(self._model.get_sentence_embedding_dimension())
+            self._labels = []
+    
+    def resolve(self, items: List[ThesisItem]) -> Tuple[List[ThesisItem], Any]:
+        """
+        Label items that closely match an already-classified thesis.
+        
+        Args:
+            items: Items awaiting classification
+            
+        Returns:
+            Tuple of (unmatched items, their embeddings) for the caller to
+            classify and then pass to add()
+        """
+        texts = [f"{item.title}\n{item.abstract}" for item in items]
+        vectors = self._model.encode(texts, normalize_embeddings=True, convert_to_numpy=True).astype('float32')
+        
+        with self._lock:
+            if self._index.ntotal == 0:
+                return items, vectors
+            scores, neighbours = self._index.search(vectors, 1)
+            matches = [self._labels[n[0]] if s[0] >= self.threshold else None
+                       for s, n in zip(scores, neighbours)]
+        
+        unmatched = []
+        for position, (item, match) in enumerate(zip(items, matches)):
+            if match is None:
+                unmatched.append(position)
+            else:
+                item.original_data["study_focus"] = {"primary": match[0], "secondary": match[1]}
+        
+        return [items[p] for p in unmatched], vectors[unmatched]
+    
+    def add(self, vectors: Any, labels: Sequence[Optional[Tuple[str, str]]]) -> None:
+        """
+        Index newly classified theses.
+        
+        Args:
+            vectors: Embeddings returned by resolve()
+            labels: (primary, secondary) per embedding, or None for failures
+        """
+        keep = [position for position, label in enumerate(labels) if label is not None]
+        if not keep:
+            return
+        with self._lock:
+            self._index.add(vectors[keep])
+            self._labels.extend(list(labels[p]) for p in keep)
+            self._unsaved_batches += 1
+            # Checkpoint periodically so a crashed run keeps most of its index
+            if self._unsaved_batches >= self.CHECKPOINT_BATCHES:
+                self._schedule_save()
+    
+    def _schedule_save(self) -> None:
+        """Snapshot the index for the background writer; the caller holds _lock."""
+        # Serializing is an in-memory copy; the disk writes happen on the
+        # writer thread so classification workers never wait on them
+        self._writer.submit(self._save, self._faiss.serialize_index(self._index), list(self._labels))
+        self._unsaved_batches = 0
+    
+    def _save(self, index_bytes: Any, labels: List[List[str]]) -> None:
+        """Write an index snapshot and its labels atomically."""
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            with open(f"{self._index_path}.tmp", 'wb') as f:
+                f.write(index_bytes.tobytes())
+            with open(f"{self._labels_path}.tmp", 'wb') as f:
+                f.write(dump_json_bytes(labels, indent=False))
+            os.replace(f"{self._index_path}.tmp", self._index_path)
+            os.replace(f"{self._labels_path}.tmp", self._labels_path)
+        except OSError:
+            pass  # Best-effort, like the exact-match cache
+    
+    def close(self) -> None:
+        """Persist the index if it gained entries and wait for pending writes."""
+        with self._lock:
+            if self._unsaved_batches:
+                self._schedule_save()
+        self._writer.shutdown(wait=True)
 
 
 class ThesisClassificationService:
@@ -195,6 +778,17 @@ class ThesisClassificationService:
         """
         self.config = config
         self.classification_service = ClassificationService(config)
+        self.cache = ClassificationCache(config.api.gemini_model, config.classification.categories)
+        self.semantic_cache: Optional[SemanticClassificationCache] = None
+        if config.classification.semantic_cache:
+            try:
+                self.semantic_cache = SemanticClassificationCache(
+                    config.api.gemini_model,
+                    config.classification.categories,
+                    config.classification.semantic_cache_threshold
+                )
+            except ImportError:
+                print("⚠️ semantic_cache needs the optional 'semantic' dependencies; continuing without it")
     
     def classify_theses_file(self, input_filename: str, force_default_categories: bool = False) -> ProcessingResult:
         """
@@ -207,62 +801,51 @@ class ThesisClassificationService:
         Returns:
             Processing result with output file path
         """
-        with PerformanceTimer("Thesis classification"):
-            try:
-                # Validate configuration
-                if not self._validate_classification_config(force_default_categories):
-                    return ProcessingResult(
-                        status=ProcessingStatus.FAILED,
-                        error_message="Classification blocked due to default categories"
-                    )
-                
-                # Load input data
-                try:
-                    with open(input_filename, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                except FileNotFoundError:
-                    return ProcessingResult(
-                        status=ProcessingStatus.FAILED,
-                        error_message=f"Input file '{input_filename}' not found"
-                    )
-                
-                # Prepare items for classification
-                items_to_classify = self._prepare_classification_items(data)
-                
-                if not items_to_classify:
-                    return ProcessingResult(
-                        status=ProcessingStatus.COMPLETED,
-                        output_file=input_filename,
-                        metadata={"message": "All items already classified"}
-                    )
-                
-                # Show classification start message
-                print(f"🤖 Starting classification of {len(items_to_classify)} items...")
-                
-                # Classify in batches
-                self._classify_items_in_batches(items_to_classify)
-                
-                # Save results
-                output_file = self._save_classified_data(data, input_filename)
-                
-                return ProcessingResult(
-                    status=ProcessingStatus.COMPLETED,
-                    output_file=output_file,
-                    metadata={
-                        "classified_count": len(items_to_classify),
-                        "total_items": self._count_total_items(data)
-                    }
-                )
-                
-            except Exception as e:
-                error_msg = f"Classification failed: {e}"
-                if self.config.verbose_logging:
-                    print(f"❌ {error_msg}")
-                
+        stream: Optional[StreamingClassification] = None
+        try:
+            # Validate configuration
+            stream = self.start_stream(force_default_categories)
+            if stream is None:
                 return ProcessingResult(
                     status=ProcessingStatus.FAILED,
-                    error_message=error_msg
+                    error_message="Classification blocked due to default categories"
                 )
+            
+            print(f"🤖 Classifying theses from {os.path.basename(input_filename)}...")
+            
+            # Batches are dispatched while the file is still being read, so
+            # parsing overlaps with the API calls instead of preceding them
+            for year, title, details in iter_thesis_records(input_filename):
+                stream.add(year, title, details)
+            
+        except FileNotFoundError:
+            if stream is not None:
+                stream.cancel()
+            return ProcessingResult(
+                status=ProcessingStatus.FAILED,
+                error_message=f"Input file '{input_filename}' not found"
+            )
+        except Exception as e:
+            if stream is not None:
+                stream.cancel()
+            error_msg = f"Classification failed: {e}"
+            if self.config.verbose_logging:
+                print(f"❌ {error_msg}")
+            return ProcessingResult(
+                status=ProcessingStatus.FAILED,
+                error_message=error_msg
+            )
+        
+        # Every record already had a study_focus, so the input file is already the result
+        if stream.item_count == 0 and stream.cached_count == 0 and stream.suppressed_count == 0:
+            stream.cancel()
+            return ProcessingResult(
+                status=ProcessingStatus.COMPLETED,
+                output_file=input_filename,
+                metadata={"message": "All items already classified"}
+            )
+        
+        return stream.finish(input_filename)
     
     def _validate_classification_config(self, force_default_categories: bool = False) -> bool:
         """Validate classification configuration."""
@@ -277,8 +860,7 @@ class ThesisClassificationService:
         
         # Check if user has confirmed custom categories
         if not self.config.classification.user_defined_categories and not force_default_categories:
-            from rich.console import Console
-            console = Console()
+            console = get_console()
             
             console.print("\n[red]❌ CLASSIFICATION BLOCKED[/red]")
             console.print("[yellow]Classification categories have not been confirmed as customized![/yellow]")
@@ -293,44 +875,52 @@ class ThesisClassificationService:
             
             return False
         elif not self.config.classification.user_defined_categories and force_default_categories:
-            from rich.console import Console
-            console = Console()
+            console = get_console()
             console.print("\n[yellow]⚠️  Using default categories for testing (accuracy may be lower)[/yellow]")
         
         return True
     
-    def _prepare_classification_items(self, data: Dict[str, Any]) -> List[ThesisItem]:
-        """Prepare items that need classification."""
-        items = []
-        item_id_counter = 0
+    def _create_classification_item(self, item_number: int, title: str,
+                                    details: Dict[str, Any]) -> Optional[ThesisItem]:
+        """Create the classification item for an unclassified thesis, or None if the cache resolves it."""
+        abstract = details.get("abstract", "") or ""
+        if _FULL_TEXT_PLACEHOLDER_RE.search(abstract):
+            abstract = ""
         
-        for year, theses in data.items():
-            for title, details in theses.items():
-                # Check if already classified
-                if self._is_already_classified(details):
-                    continue
-                
-                abstract = details.get("abstract", "") or ""
-                if "LIHAT DI FULL TEXT" in abstract.upper():
-                    abstract = ""
-                
-                items.append(ThesisItem(
-                    id=f"task_{item_id_counter}",
-                    title=title,
-                    abstract=abstract,
-                    original_data=details
-                ))
-                item_id_counter += 1
+        # Only the beginning of an abstract matters for its focus; the rest costs tokens
+        max_abstract_chars = self.config.classification.max_abstract_chars
+        if max_abstract_chars:
+            abstract = abstract[:max_abstract_chars]
         
-        return items
+        # Identical theses classified by an earlier run skip the API entirely
+        cached = self.cache.get(title, abstract)
+        if cached is not None:
+            details["study_focus"] = {"primary": cached[0], "secondary": cached[1]}
+            return None
+        
+        # Theses that keep failing are left failed until their cooldown passes
+        if self.cache.is_suppressed(title, abstract):
+            details["study_focus"] = "Classification Failed"
+            return None
+        
+        return ThesisItem(
+            id=f"task_{item_number}",
+            title=title,
+            abstract=abstract,
+            original_data=details
+        )
     
     def _is_already_classified(self, details: Dict[str, Any]) -> bool:
         """Check if thesis is already classified."""
         study_focus = details.get("study_focus")
+        if study_focus is None:
+            return False  # Freshly scraped; the common case
         
-        if isinstance(study_focus, dict) and "primary" in study_focus:
-            return True  # New format classification exists
-        elif isinstance(study_focus, str) and study_focus != "Classification Failed":
+        # Exact type checks: values come straight from JSON, never subclasses
+        study_focus_type = type(study_focus)
+        if study_focus_type is dict:
+            return "primary" in study_focus  # New format classification exists
+        elif study_focus_type is str and study_focus != "Classification Failed":
             # Convert old format to new format
             details["study_focus"] = {
                 "primary": study_focus,
@@ -340,41 +930,57 @@ class ThesisClassificationService:
         
         return False
     
-    def _classify_items_in_batches(self, items: List[ThesisItem]) -> None:
-        """Classify items in batches with progress tracking."""
-        batch_size = self.config.classification.batch_size
-        total_batches = (len(items) + batch_size - 1) // batch_size
+    def _classify_batch(self, batch: List[ThesisItem], batch_number: int,
+                        total_batches: Optional[int] = None) -> None:
+        """Classify one batch and store the results on the items' original data."""
+        progress = f"{batch_number}/{total_batches}" if total_batches else str(batch_number)
         
-        print(f"📦 Processing {len(items)} items in {total_batches} batches...")
+        # Show progress
+        print(f"⚡ Processing batch {progress} ({len(batch)} items)...")
         
-        for i in range(0, len(items), batch_size):
-            batch = items[i:i + batch_size]
-            batch_number = i // batch_size + 1
-            
-            # Show progress
-            print(f"⚡ Processing batch {batch_number}/{total_batches} ({len(batch)} items)...")
-            
-            # Prepare batch for classification
-            thesis_data = [{"title": item.title, "abstract": item.abstract} for item in batch]
-            
-            # Classify batch
-            results = self.classification_service.classify_batch(thesis_data)
-            
-            # Apply results to original data
-            for item, result in zip(batch, results):
-                if result.primary_focus != "Classification Failed":
-                    item.original_data["study_focus"] = {
-                        "primary": result.primary_focus,
-                        "secondary": result.secondary_focus
-                    }
-                else:
-                    item.original_data["study_focus"] = "Classification Failed"
-            
-            # Show batch completion
-            successful = sum(1 for r in results if r.primary_focus != "Classification Failed")
-            print(f"✅ Batch {batch_number} completed: {successful}/{len(results)} successful")
+        # Near-duplicates of theses classified before borrow their labels
+        vectors = None
+        if self.semantic_cache is not None:
+            batch_size = len(batch)
+            batch, vectors = self.semantic_cache.resolve(batch)
+            if len(batch) < batch_size:
+                print(f"♻️ Batch {batch_number}: reused {batch_size - len(batch)} classifications from similar theses")
+            if not batch:
+                return
+        
+        # Prepare batch for classification
+        thesis_data = [{"title": item.title, "abstract": item.abstract} for item in batch]
+        
+        # Classify batch
+        results = self.classification_service.classify_batch(thesis_data)
+        
+        # Apply results to original data
+        cache_entries = []
+        failed_entries = []
+        for item, result in zip(batch, results):
+            if result.primary_focus != "Classification Failed":
+                item.original_data["study_focus"] = {
+                    "primary": result.primary_focus,
+                    "secondary": result.secondary_focus
+                }
+                cache_entries.append((item.title, item.abstract, result.primary_focus, result.secondary_focus))
+            else:
+                item.original_data["study_focus"] = "Classification Failed"
+                # Only unusable model output counts towards suppression; rate limits
+                # and timeouts would otherwise lock out valid theses for the cooldown
+                if not result.transient:
+                    failed_entries.append((item.title, item.abstract))
+        self.cache.put_many(cache_entries)
+        self.cache.record_failures(failed_entries)
+        if vectors is not None:
+            self.semantic_cache.add(vectors, [
+                (r.primary_focus, r.secondary_focus) if r.primary_focus != "Classification Failed" else None
+                for r in results
+            ])
         
-        print(f"🎯 Classification processing completed for all {len(items)} items")
+        # Show batch completion
+        successful = sum(1 for r in results if r.primary_focus != "Classification Failed")
+        print(f"✅ Batch {batch_number} completed: {successful}/{len(results)} successful")
     
     def _save_classified_data(self, data: Dict[str, Any], input_filename: str) -> str:
         """Save classified data to file."""
@@ -395,8 +1001,8 @@ class ThesisClassificationService:
         
         output_file = PathManager.resolve_output_path(self.config.processing.output_dir, filename)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        with open(output_file, 'wb') as f:
+            f.write(dump_json_bytes(data))
         
         print(f"💾 Classification results saved to: {os.path.basename(output_file)}")
         
@@ -406,6 +1012,21 @@ class ThesisClassificationService:
         """Count total items in data."""
         return sum(len(theses) for theses in data.values())
     
+    def start_stream(self, force_default_categories: bool = False) -> Optional['StreamingClassification']:
+        """
+        Start classifying theses as they are scraped.
+        
+        Args:
+            force_default_categories: Whether to bypass category validation
+            
+        Returns:
+            Streaming classification to feed records into, or None if
+            classification is blocked by the category check
+        """
+        if not self._validate_classification_config(force_default_categories):
+            return None
+        return StreamingClassification(self)
+    
     def classify_repository_file(self, input_file: str) -> ProcessingResult:
         """
         Classify a repository JSON file.
@@ -420,5 +1041,170 @@ class ThesisClassificationService:
     
     def cleanup(self) -> None:
         """Clean up resources."""
-        # AI service doesn't need cleanup
-        pass
+        self.cache.close()
+        if self.semantic_cache is not None:
+            self.semantic_cache.close()
+
+
+class StreamingClassification:
+    """
+    Classification that runs alongside scraping.
+    
+    Records are grouped into batches of the configured size and each full
+    batch is classified on a background thread pool while the scraper keeps
+    producing records, so the LLM calls overlap with the page fetches.
+    
+    Pending items are collected for as many batches as can run at once, then
+    sorted by abstract length before being split, so each batch holds
+    similarly sized abstracts and batch latencies stay even. Batches close
+    at batch_size items or when the next item would exceed the
+    max_prompt_tokens budget, whichever comes first.
+    """
+    
+    def __init__(self, service: ThesisClassificationService):
+        """
+        Initialize streaming classification.
+        
+        Args:
+            service: Thesis classification service doing the actual work
+        """
+        self.service = service
+        self.batch_size = service.config.classification.batch_size
+        self.window_size = self.batch_size * service.config.classification.max_concurrent_batches
+        self.max_prompt_tokens = service.config.classification.max_prompt_tokens
+        self.data: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._pending: List[ThesisItem] = []
+        self._item_count = 0
+        self._cached_count = 0
+        self._suppressed_count = 0
+        self._batch_count = 0
+        self._executor = ThreadPoolExecutor(max_workers=service.config.classification.max_concurrent_batches)
+        self._futures: List[Future] = []
+    
+    @property
+    def item_count(self) -> int:
+        """Number of theses queued for classification so far."""
+        return self._item_count
+    
+    @property
+    def cached_count(self) -> int:
+        """Number of theses labelled from the classification cache without an API call."""
+        return self._cached_count
+    
+    @property
+    def suppressed_count(self) -> int:
+        """Number of theses left failed because their failure cooldown has not passed."""
+        return self._suppressed_count
+    
+    def add_record(self, record: Dict[str, Any]) -> None:
+        """
+        Add a scraped thesis record, dispatching a batch once it is full.
+        
+        Args:
+            record: Thesis dictionary with "year" and "title" keys plus details
+        """
+        details = dict(record)
+        year = details.pop("year")
+        title = details.pop("title")
+        self.add(year, title, details)
+    
+    def add(self, year: str, title: str, details: Dict[str, Any]) -> None:
+        """
+        Add a thesis, dispatching a batch once it is full.
+        
+        Args:
+            year: Year the thesis is grouped under
+            title: Thesis title
+            details: Remaining thesis fields; study_focus is filled in place
+        """
+        self.data.setdefault(year, {})[title] = details
+        if self.service._is_already_classified(details):
+            return
+        
+        item = self.service._create_classification_item(self._item_count, title, details)
+        if item is None:
+            # Resolved without the API: either a cached label or a suppressed failure
+            if details["study_focus"] == "Classification Failed":
+                self._suppressed_count += 1
+            else:
+                self._cached_count += 1
+            return
+        self._item_count += 1
+        self._pending.append(item)
+        
+        if len(self._pending) >= self.window_size:
+            self._dispatch_pending()
+    
+    def _dispatch_pending(self) -> None:
+        """Submit the pending items, bucketed by abstract length, to the background workers."""
+        self._pending.sort(key=lambda item: len(item.abstract))
+        
+        batch: List[ThesisItem] = []
+        batch_tokens = 0
+        for item in self._pending:
+            tokens = item.estimated_tokens
+            # An item over budget on its own still gets a batch to itself
+            over_budget = self.max_prompt_tokens and batch_tokens + tokens > self.max_prompt_tokens
+            if batch and (len(batch) >= self.batch_size or over_budget):
+                self._submit_batch(batch)
+                batch, batch_tokens = [], 0
+            batch.append(item)
+            batch_tokens += tokens
+        if batch:
+            self._submit_batch(batch)
+        self._pending = []
+    
+    def _submit_batch(self, batch: List[ThesisItem]) -> None:
+        """Submit one batch to the background workers."""
+        self._batch_count += 1
+        self._futures.append(self._executor.submit(self.service._classify_batch, batch, self._batch_count))
+    
+    def finish(self, input_filename: str) -> ProcessingResult:
+        """
+        Classify any remaining items, wait for all batches and save the results.
+        
+        Args:
+            input_filename: Scraped data file the records came from, used to
+                name the classified output
+            
+        Returns:
+            Processing result with output file path
+        """
+        with PerformanceTimer("Thesis classification"):
+            try:
+                if self._pending:
+                    self._dispatch_pending()
+                for future in self._futures:
+                    future.result()
+                
+                output_file = self.service._save_classified_data(self.data, input_filename)
+                print(f"🎯 Classification processing completed: {self._item_count} items classified, "
+                      f"{self._cached_count} from cache, {self._suppressed_count} suppressed")
+                
+                return ProcessingResult(
+                    status=ProcessingStatus.COMPLETED,
+                    output_file=output_file,
+                    metadata={
+                        "classified_count": self._item_count + self._cached_count,
+                        "api_classified_count": self._item_count,
+                        "cached_count": self._cached_count,
+                        "suppressed_count": self._suppressed_count,
+                        "total_items": self.service._count_total_items(self.data)
+                    }
+                )
+                
+            except Exception as e:
+                error_msg = f"Classification failed: {e}"
+                if self.service.config.verbose_logging:
+                    print(f"❌ {error_msg}")
+                
+                return ProcessingResult(
+                    status=ProcessingStatus.FAILED,
+                    error_message=error_msg
+                )
+            finally:
+                self._executor.shutdown(wait=False)
+    
+    def cancel(self) -> None:
+        """Stop classifying; batches that have not started yet are dropped."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
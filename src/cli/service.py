@@ -6,20 +6,31 @@ proper abstraction and dependency injection.
 """
 
 from typing import Tuple, Optional, Dict, Any
-from rich.console import Console
-from rich.prompt import Confirm, Prompt
-from rich.panel import Panel
 
 from ..core.abstractions import IUserInterface
 from ..config.service import ApplicationConfig
-from ..discovery.service import get_faculty_display_name, get_major_display_name
+from ..core.utils import get_console, get_faculty_display_name, get_major_display_name, use_plain_output
 
 
 class RichUserInterface(IUserInterface):
-    """Rich-based user interface implementation."""
+    """
+    Rich-based user interface implementation.
     
-    def __init__(self):
-        self.console = Console()
+    rich is imported on first use; status messages are printed plainly when
+    output is redirected or NO_COLOR is set, so scripted runs never load it.
+    """
+    
+    @property
+    def console(self):
+        """Rich console, created on first use."""
+        return get_console()
+    
+    def _print_status(self, message: str, style: str) -> None:
+        """Print a status line, styled unless plain output is wanted."""
+        if use_plain_output():
+            print(message)
+        else:
+            self.console.print(f"[{style}]{message}[/{style}]")
     
     def display_welcome(self) -> None:
         """Display welcome message and project info."""
@@ -35,6 +46,7 @@ Features:
 • Multiple output formats (JSON, Excel)
 • Configurable settings
         """
+        from rich.panel import Panel
         self.console.print(Panel(welcome_text, expand=False, border_style="blue"))
     
     def select_faculty_major(self, faculties: Dict[str, Any]) -> Tuple[str, str]:
@@ -83,7 +95,7 @@ Features:
         Args:
             message: Error message to display
         """
-        self.console.print(f"[red]❌ Error: {message}[/red]")
+        self._print_status(f"❌ Error: {message}", "red")
     
     def display_success(self, message: str) -> None:
         """
@@ -92,7 +104,7 @@ Features:
         Args:
             message: Success message to display
         """
-        self.console.print(f"[green]✅ {message}[/green]")
+        self._print_status(f"✅ {message}", "green")
     
     def display_warning(self, message: str) -> None:
         """
@@ -101,7 +113,7 @@ Features:
         Args:
             message: Warning message to display
         """
-        self.console.print(f"[yellow]⚠️  {message}[/yellow]")
+        self._print_status(f"⚠️  {message}", "yellow")
     
     def display_info(self, message: str) -> None:
         """
@@ -110,16 +122,19 @@ Features:
         Args:
             message: Info message to display
         """
-        self.console.print(f"[cyan]ℹ️  {message}[/cyan]")
+        self._print_status(f"ℹ️  {message}", "cyan")
     
     def _select_faculty(self, faculties: Dict[str, Any]) -> Optional[str]:
         """Select faculty from numbered list."""
+        from rich.prompt import Prompt
         self.console.print("\n[bold]Step 1: Select Faculty[/bold]")
         faculty_list = list(faculties.keys())
         
-        for i, faculty_key in enumerate(faculty_list, 1):
-            faculty_display = get_faculty_display_name(faculties, faculty_key)
-            self.console.print(f"  {i}. {faculty_display}")
+        # Render the whole list in one print rather than one rich render per line
+        self.console.print("\n".join(
+            f"  {i}. {get_faculty_display_name(faculties, faculty_key)}"
+            for i, faculty_key in enumerate(faculty_list, 1)
+        ))
         
         while True:
             try:
@@ -139,6 +154,7 @@ Features:
     
     def _select_major(self, faculties: Dict[str, Any], faculty_key: str) -> Optional[str]:
         """Select major from numbered list."""
+        from rich.prompt import Prompt
         faculty_data = faculties[faculty_key]
         faculty_display = get_faculty_display_name(faculties, faculty_key)
         
@@ -159,12 +175,10 @@ Features:
         self.console.print(f"\n[bold]Step 2: Select Major in {faculty_display}[/bold]")
         major_list = list(majors.keys())
         
-        for i, major_key in enumerate(major_list, 1):
-            if isinstance(majors[major_key], dict) and 'display_name' in majors[major_key]:
-                major_display = majors[major_key]['display_name']
-            else:
-                major_display = get_major_display_name(major_key)
-            self.console.print(f"  {i}. {major_display}")
+        self.console.print("\n".join(
+            f"  {i}. {get_major_display_name(major_key, majors[major_key])}"
+            for i, major_key in enumerate(major_list, 1)
+        ))
         
         while True:
             try:
@@ -257,6 +271,7 @@ class InteractiveFlowOrchestrator:
     
     def _offer_dynamic_discovery(self) -> bool:
         """Ask user if they want to perform dynamic discovery."""
+        from rich.prompt import Confirm
         if not self.config.enable_dynamic_discovery:
             return False
         
@@ -278,7 +293,8 @@ class InteractiveFlowOrchestrator:
                 verbose=self.config.verbose_logging
             )
             
-            updated_config = discovery_service.update_config_with_discovered_data(self.config)
+            # The user asked for an update, so fetch live data rather than the on-disk cache
+            updated_config = discovery_service.update_config_with_discovered_data(self.config, force_refresh=True)
             self.config.faculties = updated_config.faculties
             
             # Save the updated configuration to file
@@ -293,6 +309,7 @@ class InteractiveFlowOrchestrator:
     
     def _display_operation_menu(self) -> str:
         """Display operation selection menu."""
+        from rich.prompt import Prompt
         self.ui.console.print("\n[bold blue]Operation Selection[/bold blue]")
         
         operations = [
@@ -323,6 +340,7 @@ class InteractiveFlowOrchestrator:
     
     def _confirm_settings(self, faculty_key: str, major_key: str) -> bool:
         """Confirm user settings before proceeding."""
+        from rich.prompt import Confirm
         faculty_display = get_faculty_display_name(self.config.faculties, faculty_key)
         major_display = get_major_display_name(major_key, self.config.faculties[faculty_key].get('majors', {}).get(major_key))
         
@@ -335,6 +353,7 @@ class InteractiveFlowOrchestrator:
     
     def _get_input_file_interactive(self) -> Optional[str]:
         """Get input file through interactive selection."""
+        from rich.prompt import Prompt
         import os
         
         output_dir = self.config.processing.output_dir
@@ -343,8 +362,8 @@ class InteractiveFlowOrchestrator:
             self.ui.display_error(f"Output directory '{output_dir}' does not exist")
             return None
         
-        # Find JSON files in output directory
-        json_files = [f for f in os.listdir(output_dir) if f.endswith('.json')]
+        # Find JSON files (plain or gzip-compressed) in output directory
+        json_files = [f for f in os.listdir(output_dir) if f.endswith(('.json', '.json.gz'))]
         
         if not json_files:
             self.ui.display_error(f"No JSON files found in '{output_dir}'")
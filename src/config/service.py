@@ -5,27 +5,48 @@ This module provides a clean, SOLID-compliant configuration system with
 proper validation, serialization, and error handling.
 """
 
+import hashlib
+import io
+import json
 import os
+from collections import OrderedDict
 import yaml
+try:
+    from yaml import CSafeLoader as YAMLSafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as YAMLSafeLoader
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
-from rich.console import Console
 
 from ..core.abstractions import IConfigurationService, ValidationError, ConfigurationError
-from ..core.utils import ConfigurationValidator
+from ..core.utils import ConfigurationValidator, bump_options_version, get_console, get_display_name_from_key, parse_json
 
 # Load environment variables
 load_dotenv()
 
-console = Console()
+# Parsed YAML keyed by absolute path, with the (mtime_ns, size) it was read at.
+# Entries are reused while the file is unchanged; save_config() refreshes its entry.
+_RAW_CONFIG_CACHE_SIZE = 16
+_raw_config_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+
+# Parsed YAML is also persisted as JSON so a fresh process can skip the YAML parse
+_PARSED_CONFIG_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "unhas_scraper", "config")
 
 
 @dataclass
 class ClassificationConfig:
     """Configuration for thesis classification."""
     batch_size: int = 20
+    max_prompt_tokens: int = 6000  # Per-batch budget for thesis text; 0 disables it
+    max_abstract_chars: int = 2000  # Abstracts are cut to this length in prompts; 0 disables it
+    compact_prompts: bool = False  # Send category descriptions only on the first and sampled batches
     retries: int = 3
+    max_concurrent_batches: int = 4
+    requests_per_minute: int = 60  # 0 disables the limit
+    tokens_per_minute: int = 100000  # 0 disables the limit
+    semantic_cache: bool = False  # Needs the optional 'semantic' dependencies
+    semantic_cache_threshold: float = 0.95
     categories: Dict[str, str] = field(default_factory=dict)
     user_defined_categories: bool = False
 
@@ -34,7 +55,8 @@ class ClassificationConfig:
 class ScrapingConfig:
     """Configuration for web scraping."""
     headless_browser: bool = True
-    delay: float = 1.0
+    delay: float = 1.0  # Minimum seconds between requests to the repository
+    max_workers: int = 8  # Concurrent thesis page fetches (still spaced by delay)
     target_faculty: str = ""
     target_major: str = ""
 
@@ -45,6 +67,8 @@ class ProcessingConfig:
     enable_excel_export: bool = True
     enable_simplified_json: bool = True
     output_dir: str = "output"
+    compress_output: bool = False
+    simplified_format: str = "json"  # "json" or "jsonl"
 
 
 @dataclass
@@ -91,8 +115,10 @@ class ApplicationConfig:
 class ConfigurationService(IConfigurationService):
     """Service for managing application configuration."""
     
-    def __init__(self):
-        self.console = Console()
+    @property
+    def console(self):
+        """Rich console, created on first use."""
+        return get_console()
     
     def load_config(self, config_path: str) -> ApplicationConfig:
         """
@@ -114,14 +140,14 @@ class ConfigurationService(IConfigurationService):
                 create_default_config_file(config_path)
                 self.console.print(f"[green]✅ Created default configuration: {config_path}[/green]")
             
-            with open(config_path, 'r', encoding='utf-8') as f:
-                raw_config = yaml.safe_load(f) or {}
+            raw_config = self._read_raw_config(config_path)
             
-            # Expand environment variables
+            # Expand environment variables (also copies the cached tree)
             raw_config = self._expand_env_vars(raw_config)
             
             # Convert flat structure to nested configuration
             config = self._convert_to_config_object(raw_config)
+            bump_options_version()
             
             return config
             
@@ -130,6 +156,71 @@ class ConfigurationService(IConfigurationService):
         except Exception as e:
             raise ConfigurationError(f"Failed to load configuration: {e}")
     
+    def _read_raw_config(self, config_path: str) -> Dict[str, Any]:
+        """
+        Parse the YAML file, reusing the previous parse while the file is unchanged.
+        
+        The returned tree is shared with the cache and must not be mutated;
+        load_config() only reads it through _expand_env_vars(), which copies.
+        """
+        path = os.path.abspath(config_path)
+        stat = os.stat(path)
+        
+        cached = _raw_config_cache.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _raw_config_cache.move_to_end(path)
+            return cached[2]
+        
+        raw_config = self._load_parsed_sidecar(path, stat)
+        if raw_config is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                raw_config = yaml.load(f, Loader=YAMLSafeLoader) or {}
+            self._save_parsed_sidecar(path, stat, raw_config)
+        
+        _raw_config_cache[path] = (stat.st_mtime_ns, stat.st_size, raw_config)
+        if len(_raw_config_cache) > _RAW_CONFIG_CACHE_SIZE:
+            _raw_config_cache.popitem(last=False)
+        
+        return raw_config
+    
+    @staticmethod
+    def _sidecar_path(path: str) -> str:
+        """Get the parsed-config sidecar location for an absolute config path."""
+        digest = hashlib.sha1(path.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(_PARSED_CONFIG_CACHE_DIR, f"{digest}.json")
+    
+    def _load_parsed_sidecar(self, path: str, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Load the persisted parse of a config file if it matches the file's stat."""
+        try:
+            with open(self._sidecar_path(path), 'rb') as f:
+                cached = parse_json(f.read())
+            if cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                return cached['data']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+    
+    def _save_parsed_sidecar(self, path: str, stat: os.stat_result, raw_config: Dict[str, Any]) -> None:
+        """Persist a config parse for later processes (best-effort)."""
+        try:
+            # Stdlib on purpose: it rejects YAML dates and the like, where orjson
+            # would store them as strings that load back with a different type
+            payload = json.dumps({'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'data': raw_config})
+            os.makedirs(_PARSED_CONFIG_CACHE_DIR, exist_ok=True)
+            with open(self._sidecar_path(path), 'w', encoding='utf-8') as f:
+                f.write(payload)
+        except (OSError, TypeError, ValueError):
+            pass  # Non-JSON YAML values or an unwritable cache just skip persistence
+    
+    def _matches_saved_config(self, config_path: str, written_config: Dict[str, Any]) -> bool:
+        """Check whether the file at config_path already loads to written_config."""
+        try:
+            raw_config = self._read_raw_config(config_path)
+        except (OSError, yaml.YAMLError):
+            return False
+        # Compare with ${VAR} references expanded on both sides, as load_config() would
+        return self._expand_env_vars(raw_config) == self._expand_env_vars(written_config)
+    
     def save_config(self, config: ApplicationConfig, config_path: str) -> None:
         """
         Save configuration to YAML file.
@@ -142,9 +233,37 @@ class ConfigurationService(IConfigurationService):
             # Convert config object to dictionary
             config_dict = self._convert_to_dict(config)
             
-            # Write to file with custom formatting
+            # Render with custom formatting; the writer normalizes faculties (name ->
+            # display_name, no faculty url) and re-emits scalars, so compare what it
+            # produces rather than config_dict itself
+            buffer = io.StringIO()
+            self._write_formatted_yaml(buffer, config_dict)
+            content = buffer.getvalue()
+            written_config = yaml.load(content, Loader=YAMLSafeLoader) or {}
+            
+            # Skip the rewrite when the file already loads to this configuration
+            # (e.g. after re-running discovery against an unchanged repository)
+            if self._matches_saved_config(config_path, written_config):
+                return
+            
             with open(config_path, 'w', encoding='utf-8') as f:
-                self._write_formatted_yaml(f, config_dict)
+                f.write(content)
+            bump_options_version()
+            
+            # Seed the cache with the parse of the text just written, so the next
+            # load_config() sees exactly what a fresh process reading the file would
+            path = os.path.abspath(config_path)
+            stat = os.stat(path)
+            _raw_config_cache[path] = (stat.st_mtime_ns, stat.st_size, written_config)
+            _raw_config_cache.move_to_end(path)
+            if len(_raw_config_cache) > _RAW_CONFIG_CACHE_SIZE:
+                _raw_config_cache.popitem(last=False)
+            
+            # Fresh processes re-parse the YAML once and rewrite the sidecar themselves
+            try:
+                os.remove(self._sidecar_path(path))
+            except OSError:
+                pass
                 
         except Exception as e:
             raise ConfigurationError(f"Failed to save configuration: {e}")
@@ -183,6 +302,30 @@ class ConfigurationService(IConfigurationService):
         if not config.processing.output_dir:
             errors.append("Output directory is required")
         
+        if config.classification.max_prompt_tokens < 0:
+            errors.append("max_prompt_tokens must not be negative")
+        
+        if config.classification.max_abstract_chars < 0:
+            errors.append("max_abstract_chars must not be negative")
+        
+        if config.scraping.delay < 0:
+            errors.append("scraping_delay must not be negative")
+        
+        if config.scraping.max_workers < 1:
+            errors.append("scraping_workers must be at least 1")
+        
+        if config.classification.max_concurrent_batches < 1:
+            errors.append("max_concurrent_batches must be at least 1")
+        
+        if config.classification.requests_per_minute < 0 or config.classification.tokens_per_minute < 0:
+            errors.append("requests_per_minute and tokens_per_minute must not be negative")
+        
+        if not 0 < config.classification.semantic_cache_threshold <= 1:
+            errors.append("semantic_cache_threshold must be between 0 and 1")
+        
+        if config.processing.simplified_format not in ('json', 'jsonl'):
+            errors.append("simplified_format must be 'json' or 'jsonl'")
+        
         if errors:
             raise ValidationError("Configuration validation failed:\n" + "\n".join(f"- {error}" for error in errors))
         
@@ -212,6 +355,7 @@ class ConfigurationService(IConfigurationService):
         scraping_config = ScrapingConfig(
             headless_browser=raw_config.get('headless_browser', True),
             delay=raw_config.get('scraping_delay', 1.0),
+            max_workers=raw_config.get('scraping_workers', 8),
             target_faculty=raw_config.get('target_faculty', ''),
             target_major=raw_config.get('target_major', '')
         )
@@ -219,7 +363,15 @@ class ConfigurationService(IConfigurationService):
         # Classification configuration
         classification_config = ClassificationConfig(
             batch_size=raw_config.get('batch_size', 20),
+            max_prompt_tokens=raw_config.get('max_prompt_tokens', 6000),
+            max_abstract_chars=raw_config.get('max_abstract_chars', 2000),
+            compact_prompts=raw_config.get('compact_prompts', False),
             retries=raw_config.get('classification_retries', 3),
+            max_concurrent_batches=raw_config.get('max_concurrent_batches', 4),
+            requests_per_minute=raw_config.get('requests_per_minute', 60),
+            tokens_per_minute=raw_config.get('tokens_per_minute', 100000),
+            semantic_cache=raw_config.get('semantic_cache', False),
+            semantic_cache_threshold=raw_config.get('semantic_cache_threshold', 0.95),
             categories=raw_config.get('classification_categories', {}),
             user_defined_categories=raw_config.get('user_defined_categories', False)
         )
@@ -228,7 +380,9 @@ class ConfigurationService(IConfigurationService):
         processing_config = ProcessingConfig(
             enable_excel_export=raw_config.get('enable_excel_export', True),
             enable_simplified_json=raw_config.get('enable_simplified_json', True),
-            output_dir=raw_config.get('output_dir', 'output')
+            output_dir=raw_config.get('output_dir', 'output'),
+            compress_output=raw_config.get('compress_output', False),
+            simplified_format=raw_config.get('simplified_format', 'json')
         )
         
         # Create main config
@@ -255,16 +409,27 @@ class ConfigurationService(IConfigurationService):
             'output_dir': config.processing.output_dir,
             'headless_browser': config.scraping.headless_browser,
             'scraping_delay': config.scraping.delay,
+            'scraping_workers': config.scraping.max_workers,
             
             # Classification Settings
             'batch_size': config.classification.batch_size,
+            'max_prompt_tokens': config.classification.max_prompt_tokens,
+            'max_abstract_chars': config.classification.max_abstract_chars,
+            'compact_prompts': config.classification.compact_prompts,
             'classification_retries': config.classification.retries,
+            'max_concurrent_batches': config.classification.max_concurrent_batches,
+            'requests_per_minute': config.classification.requests_per_minute,
+            'tokens_per_minute': config.classification.tokens_per_minute,
+            'semantic_cache': config.classification.semantic_cache,
+            'semantic_cache_threshold': config.classification.semantic_cache_threshold,
             'target_major': config.scraping.target_major,
             'target_faculty': config.scraping.target_faculty,
             
             # Processing Settings
             'enable_excel_export': config.processing.enable_excel_export,
             'enable_simplified_json': config.processing.enable_simplified_json,
+            'compress_output': config.processing.compress_output,
+            'simplified_format': config.processing.simplified_format,
             'enable_dynamic_discovery': config.enable_dynamic_discovery,
             'user_defined_categories': config.classification.user_defined_categories,
             'verbose_logging': config.verbose_logging,
@@ -290,12 +455,21 @@ class ConfigurationService(IConfigurationService):
         file.write("# Scraping Settings\n")
         file.write(f"output_dir: {config_dict['output_dir']}\n")
         file.write(f"headless_browser: {config_dict['headless_browser']}\n")
-        file.write(f"scraping_delay: {config_dict['scraping_delay']}\n\n")
+        file.write(f"scraping_delay: {config_dict['scraping_delay']}\n")
+        file.write(f"scraping_workers: {config_dict['scraping_workers']}\n\n")
         
         # Classification Settings
         file.write("# Classification Settings\n")
         file.write(f"batch_size: {config_dict['batch_size']}\n")
+        file.write(f"max_prompt_tokens: {config_dict['max_prompt_tokens']}\n")
+        file.write(f"max_abstract_chars: {config_dict['max_abstract_chars']}\n")
+        file.write(f"compact_prompts: {config_dict['compact_prompts']}\n")
         file.write(f"classification_retries: {config_dict['classification_retries']}\n")
+        file.write(f"max_concurrent_batches: {config_dict['max_concurrent_batches']}\n")
+        file.write(f"requests_per_minute: {config_dict['requests_per_minute']}\n")
+        file.write(f"tokens_per_minute: {config_dict['tokens_per_minute']}\n")
+        file.write(f"semantic_cache: {config_dict['semantic_cache']}\n")
+        file.write(f"semantic_cache_threshold: {config_dict['semantic_cache_threshold']}\n")
         file.write(f"target_major: \"{config_dict['target_major']}\"\n")
         file.write(f"target_faculty: \"{config_dict['target_faculty']}\"\n\n")
         
@@ -303,6 +477,8 @@ class ConfigurationService(IConfigurationService):
         file.write("# Processing Settings\n")
         file.write(f"enable_excel_export: {config_dict['enable_excel_export']}\n")
         file.write(f"enable_simplified_json: {config_dict['enable_simplified_json']}\n")
+        file.write(f"compress_output: {config_dict['compress_output']}\n")
+        file.write(f"simplified_format: {config_dict['simplified_format']}\n")
         file.write(f"enable_dynamic_discovery: {config_dict['enable_dynamic_discovery']}\n")
         file.write(f"user_defined_categories: {config_dict['user_defined_categories']}\n")
         file.write(f"verbose_logging: {config_dict['verbose_logging']}\n\n")
@@ -334,14 +510,14 @@ class ConfigurationService(IConfigurationService):
             for faculty_key, faculty_data in config_dict['faculties'].items():
                 file.write(f"  {faculty_key}:\n")
                 # Handle both 'display_name' and 'name' fields
-                display_name = faculty_data.get('display_name') or faculty_data.get('name', faculty_key.replace('-', ' ').title())
+                display_name = faculty_data.get('display_name') or faculty_data.get('name') or get_display_name_from_key(faculty_key)
                 file.write(f"    display_name: {display_name}\n")
                 file.write("    majors:\n")
                 if 'majors' in faculty_data and faculty_data['majors']:
                     for major_key, major_data in faculty_data['majors'].items():
                         file.write(f"      {major_key}:\n")
                         # Handle both 'display_name' and 'name' fields for majors too
-                        major_display_name = major_data.get('display_name') or major_data.get('name', major_key.replace('-', ' ').title())
+                        major_display_name = major_data.get('display_name') or major_data.get('name') or get_display_name_from_key(major_key)
                         file.write(f"        display_name: {major_display_name}\n")
                         if 'url' in major_data:
                             file.write(f"        url: {major_data['url']}\n")
@@ -362,11 +538,11 @@ def create_default_config_file(output_path: str = "config.yaml") -> None:
     default_config = ApplicationConfig()
     config_service.save_config(default_config, output_path)
     
-    console.print(f"[green]✅ Created default configuration: {output_path}[/green]")
-    console.print("[cyan]💡 Next steps:[/cyan]")
-    console.print("  1. Set your GOOGLE_API_KEY in a .env file")
-    console.print("  2. Run 'python main.py discover' to populate faculty data")
-    console.print("  3. Customize classification categories for your domain")
+    get_console().print(f"[green]✅ Created default configuration: {output_path}[/green]")
+    get_console().print("[cyan]💡 Next steps:[/cyan]")
+    get_console().print("  1. Set your GOOGLE_API_KEY in a .env file")
+    get_console().print("  2. Run 'python main.py discover' to populate faculty data")
+    get_console().print("  3. Customize classification categories for your domain")
 
 
 def load_config(config_path: Optional[str] = None, validate: bool = True) -> ApplicationConfig:
@@ -28,10 +28,16 @@ from .utils import (
     PathManager
 )
 
-from .webdriver import (
-    WebDriverService,
-    ElementLocator
-)
+# The webdriver helpers pull in Selenium, so they are only imported on first
+# access; commands like classify or export_excel never need them.
+_LAZY_WEBDRIVER_EXPORTS = ('WebDriverService', 'ElementLocator')
+
+
+def __getattr__(name):
+    if name in _LAZY_WEBDRIVER_EXPORTS:
+        from . import webdriver
+        return getattr(webdriver, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'IWebDriver',
@@ -56,12 +56,14 @@ class ScrapingTarget:
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationResult:
     """Result of thesis classification."""
     primary_focus: str
     secondary_focus: str
     confidence: Optional[float] = None
+    # Failed for a transport or quota reason (rate limit, timeout), not bad model output
+    transient: bool = False
 
 
 class IWebDriver(Protocol):
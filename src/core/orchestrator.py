@@ -8,14 +8,11 @@ and provides the main entry point for the application.
 
 import os
 import sys
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Dict, Any, TYPE_CHECKING
 
 from ..config.service import ConfigurationService, ApplicationConfig
 from ..cli.service import RichUserInterface, InteractiveFlowOrchestrator
-from ..discovery.service import UNHASDiscoveryService
-from ..scraping.service import UNHASScrapingService
-from ..classification.service import ThesisClassificationService
-from ..processing.service import DataProcessingOrchestrator
 from ..core.abstractions import (
     IUserInterface, 
     OperationType,
@@ -23,6 +20,14 @@ from ..core.abstractions import (
     ProcessingStatus
 )
 
+# Service modules are imported lazily by their getters so that commands which
+# don't need them (e.g. export_excel) skip the Gemini and pandas imports
+if TYPE_CHECKING:
+    from ..discovery.service import UNHASDiscoveryService
+    from ..scraping.service import UNHASScrapingService
+    from ..classification.service import ThesisClassificationService
+    from ..processing.service import DataProcessingOrchestrator
+
 
 class ApplicationOrchestrator:
     """
@@ -44,10 +49,10 @@ class ApplicationOrchestrator:
         self.ui: IUserInterface = RichUserInterface()
         
         # Service instances (initialized lazily)
-        self._discovery_service: Optional[UNHASDiscoveryService] = None
-        self._scraping_service: Optional[UNHASScrapingService] = None
-        self._classification_service: Optional[ThesisClassificationService] = None
-        self._processing_service: Optional[DataProcessingOrchestrator] = None
+        self._discovery_service: Optional['UNHASDiscoveryService'] = None
+        self._scraping_service: Optional['UNHASScrapingService'] = None
+        self._classification_service: Optional['ThesisClassificationService'] = None
+        self._processing_service: Optional['DataProcessingOrchestrator'] = None
     
     def initialize(self) -> bool:
         """
@@ -95,13 +100,15 @@ class ApplicationOrchestrator:
             self.ui.display_error(f"Interactive mode failed: {e}")
             return False
     
-    def run_scraping(self, faculty: str, major: str) -> ProcessingResult:
+    def run_scraping(self, faculty: str, major: str,
+                     on_record: Optional[Callable[[Dict[str, Any]], None]] = None) -> ProcessingResult:
         """
         Run scraping operation for specific faculty/major.
         
         Args:
             faculty: Faculty key
             major: Major key
+            on_record: Optional callback receiving each scraped thesis record
             
         Returns:
             ProcessingResult with operation details
@@ -115,7 +122,7 @@ class ApplicationOrchestrator:
             self.config.scraping.target_faculty = faculty
             self.config.scraping.target_major = major
             
-            result = service.scrape_faculty_major(faculty, major)
+            result = service.scrape_faculty_major(faculty, major, on_record)
             
             if result.success:
                 self.ui.display_success(f"Scraping completed: {result.output_file}")
@@ -142,6 +149,11 @@ class ApplicationOrchestrator:
         Returns:
             ProcessingResult with operation details
         """
+        # Fail fast, before the service (and its heavy dependencies) is loaded
+        input_error = self._check_input_file(input_file)
+        if input_error is not None:
+            return input_error
+        
         try:
             service = self._get_classification_service()
             
@@ -164,22 +176,28 @@ class ApplicationOrchestrator:
                 error_message=error_msg
             )
     
-    def run_excel_export(self, input_file: str) -> ProcessingResult:
+    def run_excel_export(self, input_file: str, data: Optional[Dict[str, Any]] = None) -> ProcessingResult:
         """
         Run Excel export operation.
         
         Args:
             input_file: Path to input JSON file
+            data: Already-parsed contents of input_file, to skip reading it again
             
         Returns:
             ProcessingResult with operation details
         """
+        # Fail fast, before the service (and its heavy dependencies) is loaded
+        input_error = self._check_input_file(input_file)
+        if input_error is not None:
+            return input_error
+        
         try:
             service = self._get_processing_service()
             
             self.ui.display_info(f"Starting Excel export: {os.path.basename(input_file)}")
             
-            result = service.export_to_excel(input_file)
+            result = service.export_to_excel(input_file, data)
             
             if result.success:
                 self.ui.display_success(f"Excel export completed: {result.output_file}")
@@ -196,22 +214,28 @@ class ApplicationOrchestrator:
                 error_message=error_msg
             )
     
-    def run_simplification(self, input_file: str) -> ProcessingResult:
+    def run_simplification(self, input_file: str, data: Optional[Dict[str, Any]] = None) -> ProcessingResult:
         """
         Run data simplification operation.
         
         Args:
             input_file: Path to input JSON file
+            data: Already-parsed contents of input_file, to skip reading it again
             
         Returns:
             ProcessingResult with operation details
         """
+        # Fail fast, before the service (and its heavy dependencies) is loaded
+        input_error = self._check_input_file(input_file)
+        if input_error is not None:
+            return input_error
+        
         try:
             service = self._get_processing_service()
             
             self.ui.display_info(f"Starting simplification: {os.path.basename(input_file)}")
             
-            result = service.create_simplified_data(input_file)
+            result = service.create_simplified_data(input_file, data)
             
             if result.success:
                 self.ui.display_success(f"Simplification completed: {result.output_file}")
@@ -242,23 +266,39 @@ class ApplicationOrchestrator:
         try:
             self.ui.display_info("Starting complete pipeline")
             
-            # Step 1: Scraping
-            scrape_result = self.run_scraping(faculty, major)
+            # Steps 1 & 2: Scraping, with each batch of scraped theses classified
+            # in the background so the LLM calls overlap with the page fetches
+            classification = self._get_classification_service().start_stream()
+            if classification is None:
+                return False
+            
+            scrape_result = self.run_scraping(faculty, major, on_record=classification.add_record)
             if not scrape_result.success:
+                classification.cancel()
                 return False
             
-            # Step 2: Classification
-            classify_result = self.run_classification(scrape_result.output_file)
-            if not classify_result.success:
+            self.ui.display_info("Finishing classification of scraped theses")
+            classify_result = classification.finish(scrape_result.output_file)
+            if classify_result.success:
+                self.ui.display_success(f"Classification completed: {classify_result.output_file}")
+            else:
+                self.ui.display_error(f"Classification failed: {classify_result.error_message}")
                 return False
             
-            # Step 3: Excel Export
-            excel_result = self.run_excel_export(classify_result.output_file)
+            # Steps 3 & 4: Excel export and simplification only read the classified
+            # file, so run them side by side. Each catches its own errors.
+            self._get_processing_service()  # Create the shared service before the workers race for it
+            # The classified records are still in memory, so share them read-only
+            # instead of parsing the file that was just written
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                excel_future = executor.submit(self.run_excel_export, classify_result.output_file, classification.data)
+                simplify_future = executor.submit(self.run_simplification, classify_result.output_file, classification.data)
+                excel_result = excel_future.result()
+                simplify_result = simplify_future.result()
+            
             if not excel_result.success:
                 self.ui.display_warning("Excel export failed, but continuing...")
             
-            # Step 4: Simplification
-            simplify_result = self.run_simplification(classify_result.output_file)
             if not simplify_result.success:
                 self.ui.display_warning("Simplification failed, but pipeline mostly completed")
             
@@ -303,6 +343,33 @@ class ApplicationOrchestrator:
             self.ui.display_error(f"Discovery failed: {e}")
             return False
     
+    def _check_input_file(self, input_file: Optional[str]) -> Optional[ProcessingResult]:
+        """
+        Check that an input file was given, exists and is not empty.
+        
+        Args:
+            input_file: Path to input file
+            
+        Returns:
+            Failed ProcessingResult if the file is unusable, None otherwise
+        """
+        if not input_file:
+            error_msg = "No input file specified (use --input)"
+        else:
+            try:
+                error_msg = f"Input file '{input_file}' is empty" if os.stat(input_file).st_size == 0 else None
+            except OSError:
+                error_msg = f"Input file '{input_file}' not found"
+        
+        if error_msg is None:
+            return None
+        
+        self.ui.display_error(error_msg)
+        return ProcessingResult(
+            status=ProcessingStatus.FAILED,
+            error_message=error_msg
+        )
+    
     def _execute_operation(self, user_choices: Dict[str, Any]) -> bool:
         """Execute the operation based on user choices."""
         operation = user_choices["operation"]
@@ -342,30 +409,34 @@ class ApplicationOrchestrator:
             self.ui.display_error(f"Operation execution failed: {e}")
             return False
     
-    def _get_discovery_service(self) -> UNHASDiscoveryService:
+    def _get_discovery_service(self) -> 'UNHASDiscoveryService':
         """Get or create discovery service instance."""
         if self._discovery_service is None:
+            from ..discovery.service import UNHASDiscoveryService
             self._discovery_service = UNHASDiscoveryService(
                 headless=self.config.scraping.headless_browser,
                 verbose=self.config.verbose_logging
             )
         return self._discovery_service
     
-    def _get_scraping_service(self) -> UNHASScrapingService:
+    def _get_scraping_service(self) -> 'UNHASScrapingService':
         """Get or create scraping service instance."""
         if self._scraping_service is None:
+            from ..scraping.service import UNHASScrapingService
             self._scraping_service = UNHASScrapingService(self.config)
         return self._scraping_service
     
-    def _get_classification_service(self) -> ThesisClassificationService:
+    def _get_classification_service(self) -> 'ThesisClassificationService':
         """Get or create classification service instance."""
         if self._classification_service is None:
+            from ..classification.service import ThesisClassificationService
             self._classification_service = ThesisClassificationService(self.config)
         return self._classification_service
     
-    def _get_processing_service(self) -> DataProcessingOrchestrator:
+    def _get_processing_service(self) -> 'DataProcessingOrchestrator':
         """Get or create processing service instance."""
         if self._processing_service is None:
+            from ..processing.service import DataProcessingOrchestrator
             self._processing_service = DataProcessingOrchestrator(self.config)
         return self._processing_service
     
@@ -377,6 +448,15 @@ class ApplicationOrchestrator:
                 self._discovery_service.cleanup()
             if self._scraping_service:
                 self._scraping_service.cleanup()
+            if self._classification_service:
+                self._classification_service.cleanup()
+            
+            # Quit the browser and session shared across scrapes, whoever started them
+            # (the CLI's interactive discovery has its own discovery service). If the
+            # module was never imported nothing can be running, so skip loading Selenium.
+            webdriver_module = sys.modules.get(f"{__package__}.webdriver")
+            if webdriver_module is not None:
+                webdriver_module.WebDriverService.shutdown()
         except Exception as e:
             self.ui.display_warning(f"Cleanup warning: {e}")
 
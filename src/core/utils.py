@@ -5,21 +5,47 @@ This module contains common utility functions that are used by multiple
 components to avoid code duplication and provide consistent behavior.
 """
 
+import gzip
+import json
 import os
 import re
+import sys
 import tempfile
 import uuid
 from datetime import datetime
-from typing import Optional, Tuple, Dict, Any
-from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional, Tuple, Dict, Any, Iterator
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used without it
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional; nested JSON is parsed whole without it
+    ijson = None
 
 from .abstractions import OperationType
 
+# Precompiled helpers for TextSanitizer.clean_name_for_key
+_KEY_INVALID_CHARS_RE = re.compile(r'[^\w\-]')
+_KEY_SEPARATOR_TRANS = str.maketrans({' ': '-', '/': '-'})
+
+# Tokenizer pieces for parse_json_object_prefix
+_JSON_DECODER = json.JSONDecoder()
+_JSON_MEMBER_SEPARATOR_RE = re.compile(r'[\s,]*')
+_JSON_KEY_SEPARATOR_RE = re.compile(r'\s*:\s*')
+
+# Output files are named "<faculty>_<major>[_<operation>]_<timestamp>.<ext>"
+_FACULTY_MAJOR_FILENAME_RE = re.compile(r'(?P<faculty>[^_]*)_(?P<major>[^_]*)_')
+
 
 class FileNameExtractor:
     """Utility class for extracting information from filenames."""
     
     @staticmethod
+    @lru_cache(maxsize=64)
     def extract_faculty_major_from_filename(input_path: str) -> Tuple[Optional[str], Optional[str]]:
         """
         Extract faculty and major names from the input filename.
@@ -30,21 +56,9 @@ class FileNameExtractor:
         Returns:
             Tuple of (faculty, major) or (None, None) if extraction fails
         """
-        try:
-            filename = os.path.basename(input_path)
-            filename_without_ext = os.path.splitext(filename)[0]
-            parts = filename_without_ext.split('_')
-            
-            if len(parts) >= 3:
-                # Handle different filename patterns
-                if any(keyword in parts for keyword in ['classified', 'simplified']):
-                    return parts[0], parts[1]
-                else:
-                    return parts[0], parts[1]
-                    
-        except Exception as e:
-            print(f"Warning: Could not extract faculty/major from filename '{input_path}': {e}")
-        
+        match = _FACULTY_MAJOR_FILENAME_RE.match(os.path.basename(input_path))
+        if match:
+            return match.group('faculty'), match.group('major')
         return None, None
 
 
@@ -143,25 +157,23 @@ class TextSanitizer:
         return sanitized_text
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def clean_name_for_key(name: str) -> str:
         """
         Clean up name to create a valid identifier key.
         
+        Results are memoized; the set of faculty/major names is small.
+        
         Args:
             name: Name to clean
             
         Returns:
             Cleaned name suitable for use as key
         """
-        cleaned = name.strip().lower()
-        cleaned = cleaned.replace(' ', '-')
-        cleaned = cleaned.replace('/', '-')
-        cleaned = cleaned.replace('&', 'dan')
+        cleaned = name.strip().lower().replace('&', 'dan').translate(_KEY_SEPARATOR_TRANS)
         
         # Remove any characters that might cause issues
-        cleaned = re.sub(r'[^\w\-]', '', cleaned)
-        
-        return cleaned
+        return _KEY_INVALID_CHARS_RE.sub('', cleaned)
 
 
 class PathManager:
@@ -205,32 +217,6 @@ class PathManager:
         return os.path.join(output_dir, filename)
 
 
-@contextmanager
-def suppress_output():
-    """Context manager to suppress stdout and stderr."""
-    import sys
-    
-    if os.name == 'nt':  # Windows
-        try:
-            old_stderr = sys.stderr
-            sys.stderr = open('NUL', 'w')
-            yield
-        finally:
-            if sys.stderr != old_stderr:
-                sys.stderr.close()
-            sys.stderr = old_stderr
-    else:
-        # Unix/Linux
-        try:
-            old_stderr = sys.stderr
-            sys.stderr = open('/dev/null', 'w')
-            yield
-        finally:
-            if sys.stderr != old_stderr:
-                sys.stderr.close()
-            sys.stderr = old_stderr
-
-
 class ConfigurationValidator:
     """Utility class for configuration validation."""
     
@@ -307,10 +293,30 @@ class PerformanceTimer:
         print(f"✓ {self.operation_name} completed in {duration.total_seconds():.2f} seconds")
 
 
+@lru_cache(maxsize=None)
+def get_console():
+    """
+    Get the shared rich console, importing rich on first use.
+    
+    Returns:
+        rich.console.Console instance
+    """
+    from rich.console import Console
+    return Console()
+
+
+def use_plain_output() -> bool:
+    """Check whether output should skip rich (NO_COLOR set or stdout not a terminal)."""
+    return 'NO_COLOR' in os.environ or not sys.stdout.isatty()
+
+
+@lru_cache(maxsize=1024)
 def get_display_name_from_key(key: str) -> str:
     """
     Convert a key to display name format.
     
+    Results are memoized; the same faculty/major keys recur throughout a run.
+    
     Args:
         key: Identifier key (e.g., 'fakultas-teknik')
         
@@ -320,6 +326,236 @@ def get_display_name_from_key(key: str) -> str:
     return key.replace('-', ' ').title()
 
 
+def get_faculty_display_name(faculties: Dict[str, Any], faculty_key: str) -> str:
+    """
+    Get display name for a faculty.
+    
+    Args:
+        faculties: Faculty configuration dictionary
+        faculty_key: Faculty key
+        
+    Returns:
+        Faculty display name
+    """
+    faculty_data = faculties.get(faculty_key, {})
+    
+    if isinstance(faculty_data, dict) and 'display_name' in faculty_data:
+        return faculty_data['display_name']
+    else:
+        return get_display_name_from_key(faculty_key)
+
+
+def get_major_display_name(major_key: str, major_data: Any = None) -> str:
+    """
+    Get display name for a major.
+    
+    Args:
+        major_key: Major key
+        major_data: Major data dictionary (optional)
+        
+    Returns:
+        Major display name
+    """
+    if isinstance(major_data, dict) and 'display_name' in major_data:
+        return major_data['display_name']
+    else:
+        return get_display_name_from_key(major_key)
+
+
+def dump_json_bytes(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 JSON, using orjson when it is installed.
+    
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print with two-space indentation (the only width orjson offers)
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def parse_json(document: Any) -> Any:
+    """
+    Parse a JSON document from str or UTF-8 bytes, using orjson when it is installed.
+    
+    Args:
+        document: JSON text
+        
+    Returns:
+        Parsed data
+        
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON (orjson's
+            error type subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(document)
+    return json.loads(document)
+
+
+def parse_json_object_prefix(document: str) -> Dict[str, Any]:
+    """
+    Parse the complete members of a JSON object that may be cut off.
+    
+    Useful for responses truncated mid-object, e.g. by an output token
+    limit: every member whose value was fully written is recovered.
+    
+    Args:
+        document: Text starting with (or containing) a JSON object
+        
+    Returns:
+        Members parsed before the first incomplete or malformed one
+    """
+    members: Dict[str, Any] = {}
+    position = document.find('{') + 1
+    if not position:
+        return members
+    
+    while True:
+        position = _JSON_MEMBER_SEPARATOR_RE.match(document, position).end()
+        try:
+            key, position = _JSON_DECODER.raw_decode(document, position)
+            separator = _JSON_KEY_SEPARATOR_RE.match(document, position)
+            if not isinstance(key, str) or separator is None:
+                break
+            value, position = _JSON_DECODER.raw_decode(document, separator.end())
+        except json.JSONDecodeError:
+            break
+        members[key] = value
+    
+    return members
+
+
+def load_thesis_data(input_file: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Load thesis data as a nested {year: {title: details}} dictionary.
+    
+    Accepts either the nested JSON written by the scraper or the
+    line-delimited JSONL stream it writes while scraping is in progress,
+    optionally gzip-compressed (.gz).
+    
+    Args:
+        input_file: Path to a .json, .jsonl, .json.gz or .jsonl.gz file
+        
+    Returns:
+        Nested thesis data keyed by year, then title
+    """
+    # Both parsers accept UTF-8 bytes directly, so skip the text decoding layer
+    opener = gzip.open if input_file.endswith('.gz') else open
+    with opener(input_file, 'rb') as f:
+        if not input_file.endswith(('.jsonl', '.jsonl.gz')):
+            return parse_json(f.read())
+        
+        data: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for line in f:
+            if not line.strip():
+                continue
+            record = parse_json(line)
+            year = record.pop('year')
+            title = record.pop('title')
+            data.setdefault(year, {})[title] = record
+        return data
+
+
+def iter_thesis_records(input_file: str) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Yield each thesis in a data file without building the nested dictionary first.
+    
+    JSONL files are read line by line. Nested JSON is read one year at a
+    time when ijson is installed, and parsed whole otherwise.
+    
+    Args:
+        input_file: Path to a file accepted by load_thesis_data
+        
+    Yields:
+        Tuples of (year, title, details)
+    """
+    is_jsonl = input_file.endswith(('.jsonl', '.jsonl.gz'))
+    if not is_jsonl and ijson is None:
+        for year, theses in load_thesis_data(input_file).items():
+            for title, details in theses.items():
+                yield year, title, details
+        return
+    
+    opener = gzip.open if input_file.endswith('.gz') else open
+    with opener(input_file, 'rb') as f:
+        if is_jsonl:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = parse_json(line)
+                yield record.pop('year'), record.pop('title'), record
+        else:
+            for year, theses in ijson.kvitems(f, '', use_float=True):
+                for title, details in theses.items():
+                    yield year, title, details
+
+
+def _option_display_name(key: str, data: Any) -> str:
+    """Get the stored display name for an option, falling back to one derived from its key."""
+    if isinstance(data, dict) and 'display_name' in data:
+        return data['display_name']
+    return get_display_name_from_key(key)
+
+
+_LOOSE_MATCH_STRIP = str.maketrans('', '', ' .')
+
+
+def _normalize_option_name(name: str) -> str:
+    """Normalize a key for loose matching (case, spaces and dots ignored)."""
+    return name.lower().translate(_LOOSE_MATCH_STRIP)
+
+
+# Reverse indices keyed by id(options). Each entry keeps the dict, the options
+# version and the dict's size it was built at; config load/save and discovery
+# bump the version, so changed faculty/major data triggers a rebuild.
+_NAME_INDEX_CACHE_SIZE = 8
+_name_index_cache: Dict[int, Tuple[Dict[str, Any], int, int, Dict[str, Tuple[int, str]], Dict[str, Tuple[int, str]]]] = {}
+_options_version = 0
+
+
+def bump_options_version() -> None:
+    """Mark faculty/major options as changed so cached name lookups are rebuilt."""
+    global _options_version
+    _options_version += 1
+
+
+def _get_name_index(options: Dict[str, Any]) -> Tuple[Dict[str, Tuple[int, str]], Dict[str, Tuple[int, str]]]:
+    """
+    Get reverse lookup indices for an options dictionary.
+    
+    Args:
+        options: Dictionary of available options
+        
+    Returns:
+        Tuple of (lowercased key/display name -> (position, key),
+        loosely normalized key -> (position, key))
+    """
+    cached = _name_index_cache.get(id(options))
+    if (cached is not None and cached[0] is options
+            and cached[1] == _options_version and cached[2] == len(options)):
+        return cached[3], cached[4]
+    
+    name_index: Dict[str, Tuple[int, str]] = {}
+    normalized_index: Dict[str, Tuple[int, str]] = {}
+    for position, (key, data) in enumerate(options.items()):
+        # First key wins, matching the original first-match iteration order
+        name_index.setdefault(key.lower(), (position, key))
+        name_index.setdefault(_option_display_name(key, data).lower(), (position, key))
+        normalized_index.setdefault(_normalize_option_name(key), (position, key))
+    
+    if len(_name_index_cache) >= _NAME_INDEX_CACHE_SIZE:
+        _name_index_cache.clear()
+    _name_index_cache[id(options)] = (options, _options_version, len(options), name_index, normalized_index)
+    
+    return name_index, normalized_index
+
+
 def resolve_name_to_key(options: Dict[str, Any], input_name: str) -> str:
     """
     Resolve user input name to configuration key.
@@ -338,27 +574,17 @@ def resolve_name_to_key(options: Dict[str, Any], input_name: str) -> str:
     if input_name in options:
         return input_name
     
-    # Try display name matching
-    for key, data in options.items():
-        if isinstance(data, dict) and 'display_name' in data:
-            display_name = data['display_name']
-        else:
-            display_name = get_display_name_from_key(key)
-        
-        # Case insensitive comparison
-        if (input_name.lower() == key.lower() or 
-            input_name.lower() == display_name.lower() or
-            key.lower().replace(" ", "").replace(".", "") == 
-            input_name.lower().replace(" ", "").replace(".", "")):
-            return key
+    # Case insensitive key/display name match or loose match on the key; like the
+    # original scan, the earliest option matching either way wins
+    name_index, normalized_index = _get_name_index(options)
+    matches = [match for match in (name_index.get(input_name.lower()),
+                                   normalized_index.get(_normalize_option_name(input_name)))
+               if match is not None]
+    if matches:
+        return min(matches)[1]
     
     # Create helpful error message
-    available_names = []
-    for key, data in options.items():
-        if isinstance(data, dict) and 'display_name' in data:
-            available_names.append(f"'{data['display_name']}' (key: {key})")
-        else:
-            available_names.append(f"'{get_display_name_from_key(key)}' (key: {key})")
+    available_names = [f"'{_option_display_name(key, data)}' (key: {key})" for key, data in options.items()]
     
     raise ValueError(
         f"Unknown option: '{input_name}'. Available options:\n" +
@@ -7,34 +7,78 @@ proper resource management, error handling, and performance optimization.
 
 import os
 import logging
+import subprocess
 import tempfile
+import threading
+import time
 import uuid
-from typing import Optional, List, Any
+from typing import Optional, Dict, List, Any, Sequence, Tuple, Union
 from contextlib import contextmanager
 
+import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
-from ..core.utils import suppress_output
+
+class ThrottledSession(requests.Session):
+    """
+    Requests session that spaces its requests at least min_interval seconds apart.
+    
+    The interval is enforced across all threads using the session, so
+    concurrent workers together never exceed one request per interval.
+    """
+    
+    def __init__(self):
+        """Initialize an unthrottled session."""
+        super().__init__()
+        self.min_interval = 0.0
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0
+    
+    def request(self, *args, **kwargs) -> requests.Response:
+        """Wait for this request's slot, then send it."""
+        if self.min_interval > 0:
+            # Reserve the next slot under the lock, sleep outside it
+            with self._throttle_lock:
+                now = time.monotonic()
+                wait = self._next_request_at - now
+                self._next_request_at = max(now, self._next_request_at) + self.min_interval
+            if wait > 0:
+                time.sleep(wait)
+        return super().request(*args, **kwargs)
 
 
 class WebDriverService:
     """Enhanced web driver service with better resource management."""
     
-    def __init__(self, headless: bool = True, verbose: bool = False):
+    # Process-wide state shared by every service instance
+    _shared_driver: Optional[webdriver.Chrome] = None
+    _shared_temp_dir: Optional[str] = None
+    _shared_session: Optional[ThrottledSession] = None
+    _shared_lock = threading.Lock()
+    
+    # Connections kept per host by the shared HTTP session (the scraper's default worker count)
+    HTTP_POOL_SIZE = 8
+    
+    def __init__(self, headless: bool = True, verbose: bool = False, reuse_driver: bool = False):
         """
         Initialize web driver service.
         
         Args:
             headless: Whether to run browser in headless mode
             verbose: Whether to enable verbose logging
+            reuse_driver: Whether to share one browser across get_driver() calls
+                instead of launching and quitting one each time
         """
         self.headless = headless
         self.verbose = verbose
+        self.reuse_driver = reuse_driver
         self.driver: Optional[webdriver.Chrome] = None
         self._temp_dir: Optional[str] = None
         
@@ -43,13 +87,9 @@ class WebDriverService:
     
     def _configure_logging(self) -> None:
         """Configure logging to reduce noise."""
-        loggers = ['selenium', 'urllib3', 'webdriver_manager']
+        loggers = ['selenium', 'urllib3']
         for logger_name in loggers:
             logging.getLogger(logger_name).setLevel(logging.CRITICAL)
-        
-        # Suppress Chrome DevTools messages
-        os.environ['WDM_LOG'] = '0'
-        os.environ['WDM_PRINT_FIRST_LINE'] = 'False'
     
     def _create_chrome_options(self) -> ChromeOptions:
         """Create optimized Chrome options."""
@@ -59,6 +99,9 @@ class WebDriverService:
         if self.headless:
             options.add_argument("--headless")
         
+        # Return control once the DOM is parsed; we never need subresources
+        options.page_load_strategy = 'eager'
+        
         # Performance and stability options
         performance_options = [
             "--log-level=3",
@@ -69,7 +112,8 @@ class WebDriverService:
             "--disable-extensions",
             "--disable-gpu",
             "--disable-web-security", 
-            "--disable-features=VizDisplayCompositor"
+            "--disable-features=VizDisplayCompositor",
+            "--blink-settings=imagesEnabled=false"
         ]
         
         for option in performance_options:
@@ -79,11 +123,15 @@ class WebDriverService:
         options.add_experimental_option('excludeSwitches', ['enable-logging'])
         options.add_experimental_option('useAutomationExtension', False)
         
-        # Notification preferences
+        # Notification preferences and blocked subresources (we only read text and links)
         prefs = {
             "profile.default_content_setting_values": {
                 "notifications": 2
-            }
+            },
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.managed_default_content_settings.plugins": 2
         }
         options.add_experimental_option("prefs", prefs)
         
@@ -101,7 +149,9 @@ class WebDriverService:
     
     def _create_chrome_service(self) -> ChromeService:
         """Create Chrome service with optimized settings."""
-        service = ChromeService(ChromeDriverManager().install())
+        # No executable path: Selenium Manager resolves chromedriver from its
+        # local cache, and driver logs are discarded
+        service = ChromeService(log_output=subprocess.DEVNULL)
         
         # Windows-specific optimization
         if os.name == 'nt':
@@ -109,33 +159,132 @@ class WebDriverService:
         
         return service
     
+    def _launch_driver(self) -> webdriver.Chrome:
+        """Launch a new Chrome instance."""
+        if self.verbose:
+            print("🌐 Initializing web driver...")
+        
+        service = self._create_chrome_service()
+        options = self._create_chrome_options()
+        
+        driver = webdriver.Chrome(service=service, options=options)
+        
+        if self.verbose:
+            print("✅ Web driver initialized successfully")
+        
+        return driver
+    
+    @staticmethod
+    def _is_alive(driver: webdriver.Chrome) -> bool:
+        """Check whether a browser session still answers commands."""
+        if driver.session_id is None:
+            return False
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+    
+    def _get_shared_driver(self) -> webdriver.Chrome:
+        """Get the process-wide browser, launching it on first use or after it died."""
+        with WebDriverService._shared_lock:
+            if WebDriverService._shared_driver is not None and not self._is_alive(WebDriverService._shared_driver):
+                if self.verbose:
+                    print("⚠️  Shared web driver session lost, relaunching")
+                WebDriverService._release_shared_driver()
+            
+            if WebDriverService._shared_driver is None:
+                WebDriverService._shared_driver = self._launch_driver()
+                # The shared browser owns its profile directory, not this instance
+                WebDriverService._shared_temp_dir = self._temp_dir
+                self._temp_dir = None
+            return WebDriverService._shared_driver
+    
     @contextmanager
     def get_driver(self):
         """
         Context manager for web driver with automatic cleanup.
         
+        When reuse_driver is enabled the shared browser is yielded and left
+        running; call WebDriverService.shutdown() to close it.
+        
         Yields:
             WebDriver instance
         """
+        if self.reuse_driver:
+            driver = self._get_shared_driver()
+            # Start every session from a clean cookie jar
+            driver.delete_all_cookies()
+            yield driver
+            return
+        
         try:
-            if self.verbose:
-                print("🌐 Initializing web driver...")
-            
-            service = self._create_chrome_service()
-            options = self._create_chrome_options()
-            
-            # Create driver with suppressed output
-            with suppress_output():
-                self.driver = webdriver.Chrome(service=service, options=options)
-            
-            if self.verbose:
-                print("✅ Web driver initialized successfully")
-            
+            self.driver = self._launch_driver()
             yield self.driver
             
         finally:
             self._cleanup()
     
+    @classmethod
+    def get_http_session(cls, min_interval: Optional[float] = None) -> ThrottledSession:
+        """
+        Get the keep-alive HTTP session shared by every service.
+        
+        Discovery and scraping talk to the same host, so sharing one pooled
+        session lets later stages reuse connections earlier ones opened.
+        
+        Args:
+            min_interval: Minimum seconds between requests; updates the shared
+                session's throttle when given
+            
+        Returns:
+            Shared requests session
+        """
+        with WebDriverService._shared_lock:
+            if WebDriverService._shared_session is None:
+                session = ThrottledSession()
+                adapter = HTTPAdapter(pool_connections=cls.HTTP_POOL_SIZE, pool_maxsize=cls.HTTP_POOL_SIZE)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update({
+                    'User-Agent': 'Mozilla/5.0 (compatible; unhas-theses-scraper)',
+                    'Connection': 'keep-alive'
+                })
+                WebDriverService._shared_session = session
+            if min_interval is not None:
+                WebDriverService._shared_session.min_interval = min_interval
+            return WebDriverService._shared_session
+    
+    @classmethod
+    def shutdown(cls) -> None:
+        """Quit the shared browser, remove its profile directory and close the HTTP session."""
+        with WebDriverService._shared_lock:
+            cls._release_shared_driver()
+            if WebDriverService._shared_session is not None:
+                WebDriverService._shared_session.close()
+                WebDriverService._shared_session = None
+    
+    @staticmethod
+    def _release_shared_driver() -> None:
+        """Quit the shared browser and remove its profile (caller holds the lock)."""
+        if WebDriverService._shared_driver is not None:
+            try:
+                WebDriverService._shared_driver.quit()
+            except Exception:
+                pass  # Browser may already be gone
+            finally:
+                WebDriverService._shared_driver = None
+        
+        temp_dir = WebDriverService._shared_temp_dir
+        WebDriverService._shared_temp_dir = None
+        if temp_dir and os.path.exists(temp_dir):
+            import shutil
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    def cleanup(self) -> None:
+        """Clean up this instance's browser; the shared one is closed by shutdown()."""
+        self._cleanup()
+    
     def _cleanup(self) -> None:
         """Clean up resources."""
         if self.driver:
@@ -169,10 +318,9 @@ class WebDriverService:
         Returns:
             Element if found, None otherwise
         """
-        try:
-            return driver.find_element(by, value)
-        except NoSuchElementException:
-            return None
+        # find_elements returns [] for a miss, avoiding a remote error round-trip
+        elements = self.safe_find_elements(driver, by, value)
+        return elements[0] if elements else None
     
     def safe_find_elements(self, driver: webdriver.Chrome, by: str, value: str) -> List[Any]:
         """
@@ -188,7 +336,55 @@ class WebDriverService:
         """
         try:
             return driver.find_elements(by, value)
-        except NoSuchElementException:
+        except WebDriverException:
+            return []
+    
+    def wait_for_element(self, driver: webdriver.Chrome, by: str, value: str, timeout: float = 10) -> bool:
+        """
+        Wait until an element is present instead of sleeping a fixed time.
+        
+        Args:
+            driver: WebDriver instance
+            by: Locator strategy
+            value: Locator value
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if the element appeared, False on timeout
+        """
+        try:
+            WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, value)))
+            return True
+        except TimeoutException:
+            return False
+    
+    # Collects (text, href) for every node matching an XPath in one browser call
+    _LINKS_SCRIPT = """
+        const snapshot = document.evaluate(
+            arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        const links = [];
+        for (let i = 0; i < snapshot.snapshotLength; i++) {
+            const node = snapshot.snapshotItem(i);
+            links.push([(node.innerText || '').trim(), node.href || '']);
+        }
+        return links;
+    """
+    
+    def get_links(self, driver: webdriver.Chrome, xpath: str) -> List[Tuple[str, str]]:
+        """
+        Get text and href of all links matching an XPath in a single round-trip.
+        
+        Args:
+            driver: WebDriver instance
+            xpath: XPath expression selecting <a> elements
+            
+        Returns:
+            List of (text, href) tuples (empty list if error)
+        """
+        try:
+            return [tuple(link) for link in driver.execute_script(self._LINKS_SCRIPT, xpath)]
+        except Exception:
             return []
     
     def safe_get_text(self, element: Any) -> str:
@@ -230,6 +426,15 @@ class ElementLocator:
     THESIS_TITLE = '//*[@id="page-title"]'
     THESIS_AUTHOR = "/html/body/div[1]/div/div[2]/div/div[4]/p/span"
     THESIS_ABSTRACT = "/html/body/div[1]/div/div[2]/div/div[4]/div[3]/p"
+    THESIS_LINKS = "/html/body/div[1]/div/div[2]/div[2]/p/a"
+    
+    # EPrints summary-page anchors; tried before the positional paths above,
+    # which remain as fallbacks if the markup differs
+    THESIS_AUTHOR_BY_CLASS = '//div[contains(@class, "ep_summary_content")]//span[contains(@class, "person_name")]'
+    THESIS_ABSTRACT_BY_HEADING = (
+        '//div[contains(@class, "ep_summary_content")]'
+        '//h2[contains(., "Abstract") or contains(., "Abstrak")]/following-sibling::p[1]'
+    )
     
     @staticmethod
     def get_thesis_link_xpath(index: int) -> str:
@@ -252,67 +457,78 @@ class ElementLocator:
         return "./ul/li/a"
 
 
-def get_element_text_or_none(driver: webdriver.Chrome, xpath: str) -> Optional[str]:
+# Compiled once at import; $header/$upper/$lower are bound per call so one
+# evaluator serves every header and needs no string escaping
+_CASE_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_CASE_LOWER = "abcdefghijklmnopqrstuvwxyz"
+_XP_HEADER_CELLS = etree.XPath(
+    "//tr/*[self::th or self::td][contains(translate(., $upper, $lower), $header)]"
+)
+_XP_NEXT_CELL = etree.XPath("following-sibling::*[self::th or self::td][1]")
+_XP_NEXT_ROW_CELL = etree.XPath("../following-sibling::tr[1]/*[self::th or self::td][1]")
+
+
+def get_element_text_or_none(tree: Any,
+                             xpath: Union[str, etree.XPath, Sequence[Union[str, etree.XPath]]]) -> Optional[str]:
     """
     Safely get text from element by XPath.
     
     Args:
-        driver: WebDriver instance
-        xpath: XPath expression
+        tree: Parsed lxml HTML tree
+        xpath: XPath expression, either a string or a precompiled etree.XPath,
+            or a sequence of them tried in order until one matches
         
     Returns:
         Element text or None if not found
     """
-    web_service = WebDriverService()
-    element = web_service.safe_find_element(driver, By.XPATH, xpath)
-    return web_service.safe_get_text(element) if element else None
+    for expression in ((xpath,) if isinstance(xpath, (str, etree.XPath)) else xpath):
+        elements = expression(tree) if isinstance(expression, etree.XPath) else tree.xpath(expression)
+        if elements:
+            return elements[0].text_content().strip()
+    return None
+
+
+def normalize_table_header(header_text: str) -> str:
+    """Normalize a table header for lookup ('Item Type:' -> 'item type')."""
+    return header_text.strip().rstrip(':').strip().lower()
 
 
-def get_table_value_by_header(driver: webdriver.Chrome, header_text: str) -> Optional[str]:
+def get_table_values(tree: Any) -> Dict[str, str]:
+    """
+    Map every table header cell to the value cell next to it in one pass.
+    
+    Args:
+        tree: Parsed lxml HTML tree
+        
+    Returns:
+        Dictionary of normalized header text to value text (first occurrence wins)
+    """
+    values: Dict[str, str] = {}
+    for header_cell in tree.iter('th'):
+        value_cell = header_cell.getnext()
+        if value_cell is not None and value_cell.tag in ('th', 'td'):
+            values.setdefault(
+                normalize_table_header(header_cell.text_content()),
+                value_cell.text_content().strip()
+            )
+    return values
+
+
+def get_table_value_by_header(tree: Any, header_text: str) -> Optional[str]:
     """
     Get table value by header text using robust method.
     
     Args:
-        driver: WebDriver instance
+        tree: Parsed lxml HTML tree
         header_text: Header text to search for
         
     Returns:
         Value from table or None if not found
     """
-    try:
-        # Find all table rows
-        rows = driver.find_elements(By.XPATH, "//tr")
-        
-        for row in rows:
-            # Check if this row contains our header
-            header_cells = row.find_elements(By.XPATH, ".//th | .//td")
-            
-            for i, cell in enumerate(header_cells):
-                if header_text.lower() in cell.text.lower():
-                    # Found header, try to get value from next cell
-                    if i + 1 < len(header_cells):
-                        return header_cells[i + 1].text.strip()
-                    
-                    # If no next cell in same row, check next row
-                    try:
-                        next_row = row.find_element(By.XPATH, "./following-sibling::tr[1]")
-                        value_cells = next_row.find_elements(By.XPATH, ".//th | .//td")
-                        if value_cells:
-                            return value_cells[0].text.strip()
-                    except NoSuchElementException:
-                        pass
-        
-        return None
-        
-    except Exception:
-        return None
+    for cell in _XP_HEADER_CELLS(tree, header=header_text.lower(), upper=_CASE_UPPER, lower=_CASE_LOWER):
+        # Found header, try to get value from next cell, then from next row
+        value_cells = _XP_NEXT_CELL(cell) or _XP_NEXT_ROW_CELL(cell)
+        if value_cells:
+            return value_cells[0].text_content().strip()
     
-    def cleanup(self) -> None:
-        """Clean up webdriver resources."""
-        if self.driver:
-            try:
-                self.driver.quit()
-            except Exception:
-                pass
-            finally:
-                self.driver = None
+    return None
@@ -5,31 +5,90 @@ This module provides a clean, maintainable service for discovering
 faculties and majors from the UNHAS repository website.
 """
 
+import os
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+import requests
+from lxml import etree, html as lxml_html
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
 from ..core.abstractions import IDiscoveryService, ScrapingError
 from ..core.webdriver import WebDriverService
-from ..core.utils import TextSanitizer, PerformanceTimer
+from ..core.utils import TextSanitizer, PerformanceTimer, bump_options_version, dump_json_bytes, get_display_name_from_key, parse_json
 from ..config.service import ApplicationConfig
 
+# (faculty_key, faculty_name, faculty_url, major_key, major_name, major_url)
+DivisionEntry = Tuple[str, str, str, Optional[str], Optional[str], Optional[str]]
+
 
 class UNHASDiscoveryService(IDiscoveryService):
     """Service for discovering faculties and majors from UNHAS repository."""
     
     BASE_URL = "https://repository.unhas.ac.id/view/divisions/"
+    REQUEST_TIMEOUT = 30
+    CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "unhas_scraper", "divisions.json")
+    CACHE_TTL_SECONDS = 24 * 60 * 60
+    
+    # Compiled once; evaluated against every faculty <li> on the divisions page
+    _XP_FACULTY_ITEMS = etree.XPath("/html/body/div[1]/div/div[2]/div/ul/li/ul/li")
+    _XP_FACULTY_LINKS = etree.XPath("./a")
+    _XP_MAJOR_LINKS = etree.XPath("./ul/li/a")
     
-    def __init__(self, headless: bool = True, verbose: bool = False):
+    def __init__(self, headless: bool = True, verbose: bool = False, use_selenium: bool = False):
         """
         Initialize discovery service.
         
         Args:
             headless: Whether to run browser in headless mode
             verbose: Whether to enable verbose logging
+            use_selenium: Whether to render the divisions page with a browser
+                instead of a plain HTTP request
         """
-        self.webdriver_service = WebDriverService(headless, verbose)
+        self.webdriver_service = WebDriverService(headless, verbose, reuse_driver=True)
         self.verbose = verbose
+        self.use_selenium = use_selenium
+        self._divisions_tree = None
+        self._walk_cache: Optional[List[DivisionEntry]] = None
+        self._structure: Optional[Dict[str, Dict[str, Any]]] = None
+    
+    def _get_session(self) -> requests.Session:
+        """Get the keep-alive HTTP session shared with scraping."""
+        return WebDriverService.get_http_session()
+    
+    def _fetch_html(self, url: str) -> bytes:
+        """Fetch raw HTML for a page, using the browser only when requested."""
+        if self.use_selenium:
+            with self.webdriver_service.get_driver() as driver:
+                driver.get(url)
+                WebDriverWait(driver, self.REQUEST_TIMEOUT).until(
+                    EC.presence_of_element_located((By.XPATH, "/html/body/div[1]/div/div[2]/div/ul/li"))
+                )
+                return driver.page_source.encode('utf-8')
+        
+        response = self._get_session().get(url, timeout=self.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.content
+    
+    def _load_page(self, url: str):
+        """Fetch and parse a page into an lxml tree with absolute links."""
+        tree = lxml_html.fromstring(self._fetch_html(url))
+        tree.make_links_absolute(url)
+        return tree
+    
+    def _get_divisions_tree(self):
+        """Get the parsed divisions page, fetching it at most once per instance."""
+        if self._divisions_tree is None:
+            self._divisions_tree = self._load_page(self.BASE_URL)
+        return self._divisions_tree
+    
+    def _refresh(self) -> None:
+        """Drop the cached divisions page so the next call fetches it again."""
+        self._divisions_tree = None
+        self._walk_cache = None
+        self._structure = None
     
     def discover_faculties(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -43,14 +102,17 @@ class UNHASDiscoveryService(IDiscoveryService):
         """
         with PerformanceTimer("Faculty discovery"):
             try:
-                with self.webdriver_service.get_driver() as driver:
-                    if self.verbose:
-                        print(f"🔍 Navigating to {self.BASE_URL}")
-                    
-                    driver.get(self.BASE_URL)
-                    time.sleep(3)  # Allow page to load
-                    
-                    return self._extract_faculties_from_page(driver)
+                if self.verbose:
+                    print(f"🔍 Navigating to {self.BASE_URL}")
+                
+                faculties = {}
+                for faculty_key, faculty_name, faculty_url, *_ in self._walk_divisions():
+                    faculties.setdefault(faculty_key, {'name': faculty_name, 'url': faculty_url})
+                
+                if self.verbose:
+                    print(f"✅ Discovered {len(faculties)} faculties")
+                
+                return faculties
                     
             except Exception as e:
                 raise ScrapingError(f"Failed to discover faculties: {e}")
@@ -70,11 +132,13 @@ class UNHASDiscoveryService(IDiscoveryService):
         """
         with PerformanceTimer(f"Major discovery for {faculty_key}"):
             try:
-                with self.webdriver_service.get_driver() as driver:
-                    driver.get(self.BASE_URL)
-                    time.sleep(3)
-                    
-                    return self._extract_majors_for_faculty(driver, faculty_key)
+                structure = self._get_complete_structure()
+                majors = structure.get(faculty_key, {}).get('majors', {})
+                
+                if self.verbose:
+                    print(f"✅ Found {len(majors)} majors for {faculty_key}")
+                
+                return majors
                     
             except Exception as e:
                 raise ScrapingError(f"Failed to discover majors for {faculty_key}: {e}")
@@ -91,156 +155,99 @@ class UNHASDiscoveryService(IDiscoveryService):
         """
         with PerformanceTimer("Complete faculty/major discovery"):
             try:
-                with self.webdriver_service.get_driver() as driver:
-                    if self.verbose:
-                        print(f"🔍 Discovering all faculties and majors from {self.BASE_URL}")
-                    
-                    driver.get(self.BASE_URL)
-                    time.sleep(3)
-                    
-                    return self._extract_complete_structure(driver)
+                if self.verbose:
+                    print(f"🔍 Discovering all faculties and majors from {self.BASE_URL}")
+                
+                return self._get_complete_structure()
                     
             except Exception as e:
                 raise ScrapingError(f"Failed to discover faculties and majors: {e}")
     
-    def _extract_faculties_from_page(self, driver) -> Dict[str, Dict[str, Any]]:
-        """Extract faculty information from the main divisions page."""
-        faculties = {}
+    def _walk_divisions(self) -> List[DivisionEntry]:
+        """
+        Walk the divisions page once and return one entry per faculty/major pair.
+        
+        Faculties without majors yield a single entry whose major fields are None.
+        The result is cached until the next _refresh().
+        """
+        if self._walk_cache is not None:
+            return self._walk_cache
+        
+        entries: List[DivisionEntry] = []
         
         try:
-            # Find the main navigation structure
-            main_items = self.webdriver_service.safe_find_elements(
-                driver, By.XPATH, "/html/body/div[1]/div/div[2]/div/ul/li"
-            )
+            faculty_items = self._get_faculty_items(self._get_divisions_tree())
             
             if self.verbose:
-                print(f"📋 Found {len(main_items)} main navigation items")
+                print(f"📋 Processing {len(faculty_items)} faculty entries")
             
-            for main_item in main_items:
-                try:
-                    # Look for faculty sublists within this main item
-                    faculty_sublists = self.webdriver_service.safe_find_elements(
-                        main_item, By.XPATH, "./ul"
-                    )
+            for faculty_item in faculty_items:
+                for faculty_link in self._XP_FACULTY_LINKS(faculty_item):
+                    faculty_info = self._extract_faculty_info(faculty_link)
+                    if not faculty_info:
+                        continue
                     
-                    for faculty_sublist in faculty_sublists:
-                        faculty_links = self.webdriver_service.safe_find_elements(
-                            faculty_sublist, By.XPATH, "./li/a"
-                        )
-                        
-                        for faculty_link in faculty_links:
-                            faculty_info = self._extract_faculty_info(faculty_link)
-                            if faculty_info:
-                                faculties[faculty_info['key']] = faculty_info['data']
-                                
-                except Exception as e:
-                    if self.verbose:
-                        print(f"⚠️  Warning: Error processing main item: {e}")
-                    continue
-            
-            if self.verbose:
-                print(f"✅ Discovered {len(faculties)} faculties")
-            
-            return faculties
-            
-        except Exception as e:
-            raise ScrapingError(f"Failed to extract faculties: {e}")
-    
-    def _extract_majors_for_faculty(self, driver, target_faculty_key: str) -> Dict[str, Dict[str, Any]]:
-        """Extract majors for a specific faculty."""
-        majors = {}
-        
-        try:
-            # Find the faculty and its majors
-            main_items = self.webdriver_service.safe_find_elements(
-                driver, By.XPATH, "/html/body/div[1]/div/div[2]/div/ul/li"
-            )
-            
-            for main_item in main_items:
-                faculty_sublists = self.webdriver_service.safe_find_elements(
-                    main_item, By.XPATH, "./ul"
-                )
-                
-                for faculty_sublist in faculty_sublists:
-                    faculty_links = self.webdriver_service.safe_find_elements(
-                        faculty_sublist, By.XPATH, "./li/a"
-                    )
+                    faculty_key = faculty_info['key']
+                    faculty_name = faculty_info['data']['name']
+                    faculty_url = faculty_info['data']['url']
                     
-                    for faculty_link in faculty_links:
-                        faculty_name = self.webdriver_service.safe_get_text(faculty_link)
-                        faculty_key = TextSanitizer.clean_name_for_key(faculty_name)
-                        
-                        if faculty_key == target_faculty_key:
-                            # Found target faculty, extract its majors
-                            majors = self._extract_majors_from_faculty_element(faculty_link)
-                            break
-            
-            if self.verbose:
-                print(f"✅ Found {len(majors)} majors for {target_faculty_key}")
-            
-            return majors
+                    major_count = 0
+                    for major_link in self._XP_MAJOR_LINKS(faculty_item):
+                        major_info = self._extract_major_info(major_link)
+                        if major_info:
+                            entries.append((faculty_key, faculty_name, faculty_url, major_info['key'],
+                                            major_info['data']['name'], major_info['data']['url']))
+                            major_count += 1
+                    
+                    if not major_count:
+                        entries.append((faculty_key, faculty_name, faculty_url, None, None, None))
+                    elif self.verbose:
+                        print(f"  📁 {faculty_name}: {major_count} majors")
             
         except Exception as e:
-            raise ScrapingError(f"Failed to extract majors for {target_faculty_key}: {e}")
-    
-    def _extract_complete_structure(self, driver) -> Dict[str, Dict[str, Any]]:
-        """Extract complete faculty/major structure efficiently."""
-        faculties_and_majors = {}
+            raise ScrapingError(f"Failed to walk divisions page: {e}")
         
-        try:
-            main_items = self.webdriver_service.safe_find_elements(
-                driver, By.XPATH, "/html/body/div[1]/div/div[2]/div/ul/li"
-            )
-            
-            if self.verbose:
-                print(f"📋 Processing {len(main_items)} main sections")
-            
-            for main_item in main_items:
-                faculty_sublists = self.webdriver_service.safe_find_elements(
-                    main_item, By.XPATH, "./ul"
-                )
-                
-                for faculty_sublist in faculty_sublists:
-                    faculty_links = self.webdriver_service.safe_find_elements(
-                        faculty_sublist, By.XPATH, "./li/a"
-                    )
-                    
-                    for faculty_link in faculty_links:
-                        faculty_info = self._extract_faculty_info(faculty_link)
-                        if faculty_info:
-                            faculty_key = faculty_info['key']
-                            faculty_data = faculty_info['data']
-                            
-                            # Initialize faculty with proper structure
-                            if faculty_key not in faculties_and_majors:
-                                faculties_and_majors[faculty_key] = {
-                                    'name': faculty_data['name'],
-                                    'url': faculty_data['url'],
-                                    'majors': {}
-                                }
-                            
-                            # Extract majors for this faculty
-                            majors = self._extract_majors_from_faculty_element(faculty_link)
-                            faculties_and_majors[faculty_key]['majors'].update(majors)
-                            
-                            if self.verbose and majors:
-                                print(f"  📁 {faculty_data['name']}: {len(majors)} majors")
+        self._walk_cache = entries
+        return entries
+    
+    def _get_complete_structure(self) -> Dict[str, Dict[str, Any]]:
+        """Get the full faculty/major structure, building it at most once per page load."""
+        if self._structure is None:
+            faculties_and_majors: Dict[str, Dict[str, Any]] = {}
+            
+            for faculty_key, faculty_name, faculty_url, major_key, major_name, major_url in self._walk_divisions():
+                faculty = faculties_and_majors.get(faculty_key)
+                if faculty is None:
+                    faculty = faculties_and_majors[faculty_key] = {
+                        'name': faculty_name,
+                        'url': faculty_url,
+                        'majors': {}
+                    }
+                if major_key is not None:
+                    faculty['majors'][major_key] = {'name': major_name, 'url': major_url}
             
             if self.verbose:
                 total_faculties = len(faculties_and_majors)
-                total_majors = sum(len(faculty_data.get('majors', {})) for faculty_data in faculties_and_majors.values())
+                total_majors = sum(len(faculty_data['majors']) for faculty_data in faculties_and_majors.values())
                 print(f"✅ Discovery complete: {total_faculties} faculties, {total_majors} majors")
             
-            return faculties_and_majors
-            
-        except Exception as e:
-            raise ScrapingError(f"Failed to extract complete structure: {e}")
+            self._structure = faculties_and_majors
+        return self._structure
+    
+    def _get_faculty_items(self, tree) -> List[Any]:
+        """Get every faculty <li> on the divisions page in one XPath evaluation."""
+        return self._XP_FACULTY_ITEMS(tree)
+    
+    @staticmethod
+    def _get_link_text(link) -> str:
+        """Get the stripped text content of a link element."""
+        return (link.text_content() or "").strip()
     
     def _extract_faculty_info(self, faculty_link) -> Optional[Dict[str, Any]]:
         """Extract faculty information from link element."""
         try:
-            faculty_name = self.webdriver_service.safe_get_text(faculty_link)
-            faculty_url = self.webdriver_service.safe_get_attribute(faculty_link, 'href')
+            faculty_name = self._get_link_text(faculty_link)
+            faculty_url = faculty_link.get('href', '')
             
             if faculty_name and faculty_url and 'divisions' in faculty_url:
                 faculty_key = TextSanitizer.clean_name_for_key(faculty_name)
@@ -258,39 +265,11 @@ class UNHASDiscoveryService(IDiscoveryService):
         except Exception:
             return None
     
-    def _extract_majors_from_faculty_element(self, faculty_link) -> Dict[str, Dict[str, Any]]:
-        """Extract majors from a faculty link element."""
-        majors = {}
-        
-        try:
-            # Get the parent li element of the faculty link
-            faculty_li = faculty_link.find_element(By.XPATH, "./..")
-            
-            # Look for major sublists within this faculty
-            major_sublists = self.webdriver_service.safe_find_elements(
-                faculty_li, By.XPATH, "./ul"
-            )
-            
-            for major_sublist in major_sublists:
-                major_links = self.webdriver_service.safe_find_elements(
-                    major_sublist, By.XPATH, "./li/a"
-                )
-                
-                for major_link in major_links:
-                    major_info = self._extract_major_info(major_link)
-                    if major_info:
-                        majors[major_info['key']] = major_info['data']
-            
-            return majors
-            
-        except Exception:
-            return {}
-    
     def _extract_major_info(self, major_link) -> Optional[Dict[str, Any]]:
         """Extract major information from link element."""
         try:
-            major_name = self.webdriver_service.safe_get_text(major_link)
-            major_url = self.webdriver_service.safe_get_attribute(major_link, 'href')
+            major_name = self._get_link_text(major_link)
+            major_url = major_link.get('href', '')
             
             if major_name and major_url and 'divisions' in major_url:
                 major_key = TextSanitizer.clean_name_for_key(major_name)
@@ -308,12 +287,34 @@ class UNHASDiscoveryService(IDiscoveryService):
         except Exception:
             return None
     
-    def update_config_with_discovered_data(self, config: ApplicationConfig) -> ApplicationConfig:
+    def _load_cached_structure(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load the last discovered structure from disk if it is still fresh."""
+        try:
+            if time.time() - os.path.getmtime(self.CACHE_PATH) > self.CACHE_TTL_SECONDS:
+                return None
+            with open(self.CACHE_PATH, 'rb') as f:
+                return parse_json(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def _save_cached_structure(self, discovered_data: Dict[str, Dict[str, Any]]) -> None:
+        """Persist the discovered structure for later config refreshes."""
+        try:
+            os.makedirs(os.path.dirname(self.CACHE_PATH), exist_ok=True)
+            with open(self.CACHE_PATH, 'wb') as f:
+                f.write(dump_json_bytes(discovered_data, indent=False))
+        except OSError as e:
+            if self.verbose:
+                print(f"⚠️  Warning: Could not write discovery cache: {e}")
+    
+    def update_config_with_discovered_data(self, config: ApplicationConfig,
+                                           force_refresh: bool = False) -> ApplicationConfig:
         """
-        Update configuration with freshly discovered faculty/major data.
+        Update configuration with discovered faculty/major data.
         
         Args:
             config: Current configuration object
+            force_refresh: Whether to ignore the on-disk discovery cache
             
         Returns:
             Updated configuration object
@@ -322,33 +323,31 @@ class UNHASDiscoveryService(IDiscoveryService):
             if self.verbose:
                 print("🔄 Updating configuration with discovered data...")
             
-            # Discover all faculties and majors
-            discovered_data = self.discover_all_faculties_and_majors()
+            discovered_data = None if force_refresh else self._load_cached_structure()
+            
+            if discovered_data is not None:
+                if self.verbose:
+                    print(f"📦 Using cached discovery data from {self.CACHE_PATH}")
+            else:
+                # Rebuild from the live page and remember the result
+                self._refresh()
+                discovered_data = self.discover_all_faculties_and_majors()
+                if discovered_data:
+                    self._save_cached_structure(discovered_data)
             
             if discovered_data:
-                # Convert discovery format to config format
-                config_faculties = {}
-                
-                for faculty_key, faculty_data in discovered_data.items():
-                    # Get faculty info from the discovery data
-                    faculty_display_name = faculty_data.get('name', faculty_key.replace('-', ' ').title())
-                    
-                    # Convert majors to the expected format
-                    config_majors = {}
-                    majors_dict = faculty_data.get('majors', {})
-                    for major_key, major_info in majors_dict.items():
-                        config_majors[major_key] = {
-                            'display_name': major_info.get('name', major_key.replace('-', ' ').title()),
-                            'url': major_info.get('url', '')
-                        }
-                    
-                    config_faculties[faculty_key] = {
-                        'display_name': faculty_display_name,
-                        'majors': config_majors
+                # Convert discovery format to config format in one pass
+                config_faculties = {
+                    faculty_key: {
+                        'display_name': faculty_data.get('name') or get_display_name_from_key(faculty_key),
+                        'majors': self._to_config_majors(faculty_data.get('majors', {}))
                     }
+                    for faculty_key, faculty_data in discovered_data.items()
+                }
                 
                 # Update the configuration
                 config.faculties = config_faculties
+                bump_options_version()
                 
                 if self.verbose:
                     total_faculties = len(config_faculties)
@@ -363,6 +362,17 @@ class UNHASDiscoveryService(IDiscoveryService):
         except Exception as e:
             raise ScrapingError(f"Failed to update configuration with discovered data: {e}")
     
+    @staticmethod
+    def _to_config_majors(majors: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+        """Convert discovered majors to the configuration format."""
+        return {
+            major_key: {
+                'display_name': major_info.get('name') or get_display_name_from_key(major_key),
+                'url': major_info.get('url', '')
+            }
+            for major_key, major_info in majors.items()
+        }
+    
     def discover_faculties_and_majors(self) -> Dict[str, Dict[str, Any]]:
         """
         Alias for discover_all_faculties_and_majors for backward compatibility.
@@ -373,42 +383,8 @@ class UNHASDiscoveryService(IDiscoveryService):
         return self.discover_all_faculties_and_majors()
     
     def cleanup(self) -> None:
-        """Clean up resources."""
+        """Clean up resources; the shared browser and session are closed by the orchestrator."""
+        self._refresh()
         if hasattr(self, 'webdriver_service'):
-            self.webdriver_service._cleanup()
+            self.webdriver_service.cleanup()
 
-
-def get_faculty_display_name(faculties: Dict[str, Any], faculty_key: str) -> str:
-    """
-    Get display name for a faculty.
-    
-    Args:
-        faculties: Faculty configuration dictionary
-        faculty_key: Faculty key
-        
-    Returns:
-        Faculty display name
-    """
-    faculty_data = faculties.get(faculty_key, {})
-    
-    if isinstance(faculty_data, dict) and 'display_name' in faculty_data:
-        return faculty_data['display_name']
-    else:
-        return faculty_key.replace('-', ' ').title()
-
-
-def get_major_display_name(major_key: str, major_data: Any = None) -> str:
-    """
-    Get display name for a major.
-    
-    Args:
-        major_key: Major key
-        major_data: Major data dictionary (optional)
-        
-    Returns:
-        Major display name
-    """
-    if isinstance(major_data, dict) and 'display_name' in major_data:
-        return major_data['display_name']
-    else:
-        return major_key.replace('-', ' ').title()
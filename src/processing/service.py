@@ -5,9 +5,9 @@ This module provides clean, maintainable services for converting
 and processing thesis data into various formats.
 """
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from ..core.abstractions import (
     IExcelExporter, 
@@ -16,7 +16,15 @@ from ..core.abstractions import (
     ProcessingStatus,
     OperationType
 )
-from ..core.utils import TextSanitizer, FileNameExtractor, FileNameGenerator, PathManager, PerformanceTimer
+from ..core.utils import (
+    TextSanitizer,
+    FileNameExtractor,
+    FileNameGenerator,
+    PathManager,
+    PerformanceTimer,
+    dump_json_bytes,
+    load_thesis_data
+)
 from ..config.service import ApplicationConfig
 
 
@@ -32,12 +40,13 @@ class ExcelExportService(IExcelExporter):
         """
         self.config = config
     
-    def convert_to_excel(self, input_file: str) -> ProcessingResult:
+    def convert_to_excel(self, input_file: str, data: Optional[Dict[str, Any]] = None) -> ProcessingResult:
         """
         Convert JSON data to Excel format.
         
         Args:
             input_file: Path to input JSON file
+            data: Already-parsed contents of input_file, to skip reading it again
             
         Returns:
             Processing result with output file path
@@ -45,14 +54,14 @@ class ExcelExportService(IExcelExporter):
         with PerformanceTimer("Excel export"):
             try:
                 # Load input data
-                try:
-                    with open(input_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                except FileNotFoundError:
-                    return ProcessingResult(
-                        status=ProcessingStatus.FAILED,
-                        error_message=f"Input file '{input_file}' not found"
-                    )
+                if data is None:
+                    try:
+                        data = load_thesis_data(input_file)
+                    except FileNotFoundError:
+                        return ProcessingResult(
+                            status=ProcessingStatus.FAILED,
+                            error_message=f"Input file '{input_file}' not found"
+                        )
                 
                 # Convert to DataFrame
                 df = self._convert_to_dataframe(data)
@@ -178,12 +187,13 @@ class DataSimplificationService(IDataSimplifier):
         """
         self.config = config
     
-    def simplify_data(self, input_file: str) -> ProcessingResult:
+    def simplify_data(self, input_file: str, data: Optional[Dict[str, Any]] = None) -> ProcessingResult:
         """
         Create simplified version of data.
         
         Args:
             input_file: Path to input JSON file
+            data: Already-parsed contents of input_file, to skip reading it again
             
         Returns:
             Processing result with output file path
@@ -191,24 +201,28 @@ class DataSimplificationService(IDataSimplifier):
         with PerformanceTimer("Data simplification"):
             try:
                 # Load input data
-                try:
-                    with open(input_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                except FileNotFoundError:
-                    return ProcessingResult(
-                        status=ProcessingStatus.FAILED,
-                        error_message=f"Input file '{input_file}' not found"
-                    )
+                if data is None:
+                    try:
+                        data = load_thesis_data(input_file)
+                    except FileNotFoundError:
+                        return ProcessingResult(
+                            status=ProcessingStatus.FAILED,
+                            error_message=f"Input file '{input_file}' not found"
+                        )
                 
                 # Create simplified data
                 simplified_data = self._create_simplified_data(data)
                 
                 # Generate output filename
-                output_file = self._generate_output_filename(input_file)
+                output_format = self.config.processing.simplified_format
+                output_file = self._generate_output_filename(input_file, output_format)
                 
                 # Save simplified data
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(simplified_data, f, indent=4, ensure_ascii=False)
+                if output_format == 'jsonl':
+                    self._write_json_lines(simplified_data, output_file)
+                else:
+                    with open(output_file, 'wb') as f:
+                        f.write(dump_json_bytes(simplified_data))
                 
                 if self.config.verbose_logging:
                     print(f"✅ Successfully created simplified JSON file at: {output_file}")
@@ -218,7 +232,7 @@ class DataSimplificationService(IDataSimplifier):
                     output_file=output_file,
                     metadata={
                         "total_items": len(simplified_data),
-                        "format": "simplified_json"
+                        "format": f"simplified_{output_format}"
                     }
                 )
                 
@@ -264,19 +278,25 @@ class DataSimplificationService(IDataSimplifier):
         
         return simplified_list
     
-    def _generate_output_filename(self, input_file: str) -> str:
+    def _write_json_lines(self, records: List[Dict[str, Any]], output_file: str) -> None:
+        """Write records one JSON object per line, so readers can stream them."""
+        with open(output_file, 'wb') as f:
+            for record in records:
+                f.write(dump_json_bytes(record, indent=False) + b'\n')
+    
+    def _generate_output_filename(self, input_file: str, extension: str = "json") -> str:
         """Generate output filename for simplified data."""
         # Extract faculty/major from input filename
         faculty, major = FileNameExtractor.extract_faculty_major_from_filename(input_file)
         
         if faculty and major:
             filename = FileNameGenerator.generate_filename(
-                OperationType.SIMPLIFY, faculty, major, extension="json"
+                OperationType.SIMPLIFY, faculty, major, extension=extension
             )
         else:
             # Fallback to generic name
             filename = FileNameGenerator.generate_filename(
-                OperationType.SIMPLIFY, "unhas", "repository", extension="json"
+                OperationType.SIMPLIFY, "unhas", "repository", extension=extension
             )
         
         return PathManager.resolve_output_path(self.config.processing.output_dir, filename)
@@ -306,40 +326,50 @@ class DataProcessingOrchestrator:
         Returns:
             Dictionary of format names to processing results
         """
-        results = {}
+        futures = {}
         
-        if self.config.processing.enable_excel_export:
-            if self.config.verbose_logging:
-                print("📊 Converting to Excel format...")
-            results['excel'] = self.excel_service.convert_to_excel(input_file)
+        # Parse once and share the (read-only) data between both formats
+        try:
+            data = load_thesis_data(input_file)
+        except Exception:
+            data = None  # Each service reports the load error itself
         
-        if self.config.processing.enable_simplified_json:
-            if self.config.verbose_logging:
-                print("📝 Creating simplified JSON...")
-            results['simplified'] = self.simplification_service.simplify_data(input_file)
+        # Both formats only read the input data, so they run concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if self.config.processing.enable_excel_export:
+                if self.config.verbose_logging:
+                    print("📊 Converting to Excel format...")
+                futures['excel'] = executor.submit(self.excel_service.convert_to_excel, input_file, data)
+            
+            if self.config.processing.enable_simplified_json:
+                if self.config.verbose_logging:
+                    print("📝 Creating simplified JSON...")
+                futures['simplified'] = executor.submit(self.simplification_service.simplify_data, input_file, data)
         
-        return results
+        return {name: future.result() for name, future in futures.items()}
     
-    def create_simplified_data(self, input_file: str) -> ProcessingResult:
+    def create_simplified_data(self, input_file: str, data: Optional[Dict[str, Any]] = None) -> ProcessingResult:
         """
         Create simplified JSON data from input file.
         
         Args:
             input_file: Path to input JSON file
+            data: Already-parsed contents of input_file, to skip reading it again
             
         Returns:
             Processing result with output file path
         """
-        return self.simplification_service.simplify_data(input_file)
+        return self.simplification_service.simplify_data(input_file, data)
     
-    def export_to_excel(self, input_file: str) -> ProcessingResult:
+    def export_to_excel(self, input_file: str, data: Optional[Dict[str, Any]] = None) -> ProcessingResult:
         """
         Export data to Excel format.
         
         Args:
             input_file: Path to input JSON file
+            data: Already-parsed contents of input_file, to skip reading it again
             
         Returns:
             Processing result with output file path
         """
-        return self.excel_service.convert_to_excel(input_file)
+        return self.excel_service.convert_to_excel(input_file, data)
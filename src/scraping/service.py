@@ -5,17 +5,63 @@ This module provides a clean, maintainable service for scraping
 thesis data from the UNHAS repository.
 """
 
-import json
+import gzip
+import os
+import threading
 import time
-from typing import Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterator, List, Optional
 
+import requests
+from lxml import etree, html as lxml_html
 from selenium.webdriver.common.by import By
 
 from ..core.abstractions import IScrapingService, ScrapingTarget, ProcessingResult, ProcessingStatus, ScrapingError
-from ..core.webdriver import WebDriverService, get_element_text_or_none, get_table_value_by_header
-from ..core.utils import FileNameGenerator, PathManager, PerformanceTimer
+from ..core.webdriver import (
+    WebDriverService,
+    ElementLocator,
+    get_element_text_or_none,
+    get_table_values,
+    get_table_value_by_header,
+    normalize_table_header
+)
+from ..core.utils import (
+    FileNameGenerator,
+    PathManager,
+    PerformanceTimer,
+    dump_json_bytes,
+    get_faculty_display_name,
+    get_major_display_name,
+    load_thesis_data,
+    resolve_name_to_key
+)
 from ..config.service import ApplicationConfig
 
+# One reusable HTML parser per worker thread (lxml parsers must not be shared
+# across threads). Blank text is kept: whitespace-only tails separate words
+# between inline tags in abstracts.
+_parser_local = threading.local()
+
+
+def _get_html_parser() -> etree.HTMLParser:
+    """Get this thread's HTML parser, creating it on first use."""
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = _parser_local.parser = lxml_html.HTMLParser(remove_comments=True)
+    return parser
+
+
+# Thesis page XPaths, compiled once and evaluated against each parsed page
+_XP_THESIS_TITLE = etree.XPath(ElementLocator.THESIS_TITLE)
+_XP_THESIS_AUTHOR = (
+    etree.XPath(ElementLocator.THESIS_AUTHOR_BY_CLASS),
+    etree.XPath(ElementLocator.THESIS_AUTHOR)
+)
+_XP_THESIS_ABSTRACT = (
+    etree.XPath(ElementLocator.THESIS_ABSTRACT_BY_HEADING),
+    etree.XPath(ElementLocator.THESIS_ABSTRACT)
+)
+
 
 class ThesisData:
     """Data container for thesis information."""
@@ -48,6 +94,9 @@ class ThesisData:
 class UNHASScrapingService(IScrapingService):
     """Service for scraping thesis data from UNHAS repository."""
     
+    REQUEST_TIMEOUT = 30
+    PAGE_LOAD_TIMEOUT = 10
+    
     def __init__(self, config: ApplicationConfig):
         """
         Initialize scraping service.
@@ -58,15 +107,30 @@ class UNHASScrapingService(IScrapingService):
         self.config = config
         self.webdriver_service = WebDriverService(
             headless=config.scraping.headless_browser,
-            verbose=config.verbose_logging
+            verbose=config.verbose_logging,
+            reuse_driver=True
         )
     
-    def scrape_repository(self, target: ScrapingTarget) -> ProcessingResult:
+    def _get_session(self) -> requests.Session:
+        """Get the keep-alive HTTP session, shared with discovery and pooled for the detail workers."""
+        # Requests are spaced by scraping_delay across all workers, to stay polite to the repository
+        return WebDriverService.get_http_session(min_interval=self.config.scraping.delay)
+    
+    def _fetch_page(self, url: str):
+        """Fetch a static page over HTTP and parse it with lxml."""
+        response = self._get_session().get(url, timeout=self.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return lxml_html.fromstring(response.content, parser=_get_html_parser())
+    
+    def scrape_repository(self, target: ScrapingTarget,
+                          on_record: Optional[Callable[[Dict[str, Any]], None]] = None) -> ProcessingResult:
         """
         Scrape thesis data from repository.
         
         Args:
             target: Scraping target with faculty/major information
+            on_record: Optional callback receiving each thesis record once it is saved,
+                so later stages can start before scraping finishes
             
         Returns:
             Processing result with output file path
@@ -77,27 +141,35 @@ class UNHASScrapingService(IScrapingService):
                     print(f"🎓 Scraping {target.faculty_display} - {target.major_display}")
                     print(f"🔗 Target URL: {target.url}")
                 
-                with self.webdriver_service.get_driver() as driver:
-                    # Navigate to target URL
-                    driver.get(target.url)
-                    time.sleep(3)
-                    
-                    # Extract all thesis data
-                    repository_data = self._extract_repository_data(driver, target)
-                    
-                    # Save to file
-                    output_file = self._save_repository_data(repository_data, target)
-                    
-                    return ProcessingResult(
-                        status=ProcessingStatus.COMPLETED,
-                        output_file=output_file,
-                        metadata={
-                            "faculty": target.faculty_display,
-                            "major": target.major_display,
-                            "total_theses": sum(len(year_data) for year_data in repository_data.values())
-                        }
-                    )
-                    
+                # Create the output directory and open the stream before launching
+                # the browser, so an unwritable output path fails before any scraping
+                output_file = self._generate_output_path(target)
+                stream_file = os.path.splitext(output_file)[0] + ".jsonl"
+                if self.config.processing.compress_output:
+                    output_file += ".gz"
+                
+                with open(stream_file, 'wb') as stream:
+                    # Stream thesis data to the JSONL file as it is scraped, so
+                    # nothing accumulates in memory and a crash keeps prior work
+                    for record in self.iter_scraped_theses(target):
+                        stream.write(dump_json_bytes(record, indent=False) + b"\n")
+                        stream.flush()
+                        if on_record is not None:
+                            on_record(record)
+                
+                # Save to file
+                total_theses = self._save_repository_data(stream_file, output_file)
+                
+                return ProcessingResult(
+                    status=ProcessingStatus.COMPLETED,
+                    output_file=output_file,
+                    metadata={
+                        "faculty": target.faculty_display,
+                        "major": target.major_display,
+                        "total_theses": total_theses
+                    }
+                )
+                
             except Exception as e:
                 error_msg = f"Failed to scrape repository: {e}"
                 if self.config.verbose_logging:
@@ -108,13 +180,15 @@ class UNHASScrapingService(IScrapingService):
                     error_message=error_msg
                 )
     
-    def scrape_faculty_major(self, faculty_key: str, major_key: str) -> ProcessingResult:
+    def scrape_faculty_major(self, faculty_key: str, major_key: str,
+                             on_record: Optional[Callable[[Dict[str, Any]], None]] = None) -> ProcessingResult:
         """
         Scrape thesis data for a specific faculty and major.
         
         Args:
             faculty_key: Faculty key from configuration
             major_key: Major key from configuration
+            on_record: Optional callback receiving each scraped thesis record
             
         Returns:
             ProcessingResult with output file path
@@ -124,7 +198,7 @@ class UNHASScrapingService(IScrapingService):
             target = self._create_scraping_target(faculty_key, major_key)
             
             # Use the existing scrape_repository method
-            return self.scrape_repository(target)
+            return self.scrape_repository(target, on_record)
             
         except Exception as e:
             error_msg = f"Failed to scrape faculty/major {faculty_key}/{major_key}: {e}"
@@ -137,12 +211,9 @@ class UNHASScrapingService(IScrapingService):
             )
     
     def _create_scraping_target(self, faculty_key: str, major_key: str) -> ScrapingTarget:
-        """Create a ScrapingTarget from faculty/major keys."""
-        from ..discovery.service import get_faculty_display_name, get_major_display_name
-        
-        # Get faculty data
-        if faculty_key not in self.config.faculties:
-            raise ValueError(f"Faculty key '{faculty_key}' not found in configuration")
+        """Create a ScrapingTarget from faculty/major keys or display names."""
+        # Get faculty data (names like "Fakultas Teknik" resolve through the cached name index)
+        faculty_key = resolve_name_to_key(self.config.faculties, faculty_key)
         
         faculty_data = self.config.faculties[faculty_key]
         faculty_display = get_faculty_display_name(self.config.faculties, faculty_key)
@@ -153,8 +224,7 @@ class UNHASScrapingService(IScrapingService):
         else:
             majors = faculty_data
         
-        if major_key not in majors:
-            raise ValueError(f"Major key '{major_key}' not found in faculty '{faculty_key}'")
+        major_key = resolve_name_to_key(majors, major_key)
         
         major_data = majors[major_key]
         major_display = get_major_display_name(major_key, major_data)
@@ -194,86 +264,103 @@ class UNHASScrapingService(IScrapingService):
         Returns:
             Thesis data dictionary
         """
-        with self.webdriver_service.get_driver() as driver:
-            driver.get(url)
-            time.sleep(self.config.scraping.delay)
-            
-            return self._extract_single_thesis_data(driver, url)
+        return self._extract_single_thesis_data(self._fetch_page(url), url)
     
-    def _extract_repository_data(self, driver, target: ScrapingTarget) -> Dict[str, Dict[str, Dict[str, Any]]]:
-        """Extract all thesis data from repository."""
-        repository_data = {}
+    def iter_scraped_theses(self, target: ScrapingTarget) -> Iterator[Dict[str, Any]]:
+        """
+        Scrape a repository target, yielding each thesis as soon as it is ready.
         
-        # Find all year links on the main page
-        year_elements = self.webdriver_service.safe_find_elements(
-            driver, By.XPATH, "/html/body/div[1]/div/div[2]/div/ul/li/a"
-        )
+        Records are yielded in year and listing order, so consumers can start
+        processing before the whole scrape finishes.
         
-        year_links = []
-        for elem in year_elements:
-            year_text = self.webdriver_service.safe_get_text(elem)
-            year_url = self.webdriver_service.safe_get_attribute(elem, 'href')
-            if year_text and year_url:
-                year_links.append((year_text, year_url))
+        Args:
+            target: Scraping target with faculty/major information
+            
+        Yields:
+            Thesis dictionaries with "year" and "title" keys plus thesis details
+        """
+        with self.webdriver_service.get_driver() as driver:
+            # Navigate to target URL
+            driver.get(target.url)
+            self.webdriver_service.wait_for_element(
+                driver, By.XPATH, ElementLocator.get_year_links_xpath(), self.PAGE_LOAD_TIMEOUT
+            )
+            
+            yield from self._extract_repository_data(driver, target)
+    
+    def _extract_repository_data(self, driver, target: ScrapingTarget) -> Iterator[Dict[str, Any]]:
+        """Extract all thesis data from repository, yielding one record per thesis."""
+        # Find all year links on the main page in one browser call
+        year_links = [
+            (year_text, year_url)
+            for year_text, year_url in self.webdriver_service.get_links(
+                driver, ElementLocator.get_year_links_xpath()
+            )
+            if year_text and year_url
+        ]
         
         if self.config.verbose_logging:
             print(f"📅 Found {len(year_links)} years to process")
         
-        # Process each year
-        for year_text, year_url in year_links:
-            # Always show year processing to user
-            print(f"\n📋 Processing Year: {year_text}")
-            
-            repository_data[year_text] = {}
-            driver.get(year_url)
-            time.sleep(2)
-            
-            # Extract thesis URLs for this year
-            thesis_urls = self._extract_thesis_urls_for_year(driver)
-            
-            # Always show thesis count to user
-            print(f"   Found {len(thesis_urls)} theses")
+        # Thesis pages are static HTML, so they are fetched concurrently over HTTP.
+        # A year's results are drained only after the next year's listing has been
+        # read and queued, so listing navigation overlaps the detail workers.
+        pending_year = None
+        with ThreadPoolExecutor(max_workers=self.config.scraping.max_workers) as executor:
+            # Process each year
+            for year_text, year_url in year_links:
+                # Always show year processing to user
+                print(f"\n📋 Processing Year: {year_text}")
+                
+                # Listing pages go through the browser, outside the session's throttle
+                time.sleep(self.config.scraping.delay)
+                driver.get(year_url)
+                self.webdriver_service.wait_for_element(
+                    driver, By.XPATH, "/html/body/div[1]/div/div[2]/div[2]", self.PAGE_LOAD_TIMEOUT
+                )
+                
+                # Extract thesis URLs for this year
+                thesis_urls = self._extract_thesis_urls_for_year(driver)
+                
+                # Always show thesis count to user
+                print(f"   Found {len(thesis_urls)} theses")
+                
+                # Queue each thesis; results are collected in listing order
+                futures = [
+                    executor.submit(self._process_single_thesis, thesis_url, target, i, len(thesis_urls))
+                    for i, thesis_url in enumerate(thesis_urls, 1)
+                ]
+                
+                if pending_year:
+                    yield from self._collect_year_results(*pending_year)
+                pending_year = (year_text, futures)
             
-            # Process each thesis
-            for i, thesis_url in enumerate(thesis_urls, 1):
-                thesis_data = self._process_single_thesis(driver, thesis_url, target, i, len(thesis_urls))
-                if thesis_data:
-                    repository_data[year_text][thesis_data.title] = thesis_data.to_dict()
-        
-        return repository_data
+            if pending_year:
+                yield from self._collect_year_results(*pending_year)
+    
+    def _collect_year_results(self, year_text: str, futures: List[Future]) -> Iterator[Dict[str, Any]]:
+        """Wait for a year's thesis workers and yield their results in listing order."""
+        for future in futures:
+            thesis_data = future.result()
+            if thesis_data:
+                yield {"year": year_text, "title": thesis_data.title, **thesis_data.to_dict()}
     
     def _extract_thesis_urls_for_year(self, driver) -> list:
-        """Extract all thesis URLs for a given year."""
-        thesis_urls = []
-        thesis_index = 1
-        
-        while True:
-            try:
-                xpath = f"/html/body/div[1]/div/div[2]/div[2]/p[{thesis_index}]/a"
-                thesis_link_element = self.webdriver_service.safe_find_element(driver, By.XPATH, xpath)
-                
-                if thesis_link_element:
-                    url = self.webdriver_service.safe_get_attribute(thesis_link_element, 'href')
-                    if url:
-                        thesis_urls.append(url)
-                    thesis_index += 1
-                else:
-                    break  # No more thesis links found
-                    
-            except Exception:
-                break  # Exit loop on any error
-        
-        return thesis_urls
+        """Extract all thesis URLs for a given year in a single browser call."""
+        return [
+            url for _, url in self.webdriver_service.get_links(driver, ElementLocator.THESIS_LINKS)
+            if url
+        ]
     
-    def _process_single_thesis(self, driver, thesis_url: str, target: ScrapingTarget, 
+    def _process_single_thesis(self, thesis_url: str, target: ScrapingTarget,
                              index: int, total: int) -> Optional[ThesisData]:
-        """Process a single thesis page."""
+        """Process a single thesis page (runs on a worker thread)."""
         try:
-            driver.get(thesis_url)
-            time.sleep(self.config.scraping.delay)
+            # Fetch and parse the page once; every field is then extracted in-process
+            page = self._fetch_page(thesis_url)
             
             # Extract title
-            title = get_element_text_or_none(driver, '//*[@id="page-title"]')
+            title = get_element_text_or_none(page, _XP_THESIS_TITLE)
             if not title:
                 # Always show skipped entries
                 print(f"  - Skipping entry {index}/{total} (Title not found)")
@@ -286,15 +373,7 @@ class UNHASScrapingService(IScrapingService):
             thesis_data = ThesisData(title, thesis_url, target.faculty_key, target.major_key)
             
             # Extract detailed information
-            thesis_data.author = get_element_text_or_none(
-                driver, "/html/body/div[1]/div/div[2]/div/div[4]/p/span"
-            )
-            thesis_data.abstract = get_element_text_or_none(
-                driver, "/html/body/div[1]/div/div[2]/div/div[4]/div[3]/p"
-            )
-            thesis_data.item_type = get_table_value_by_header(driver, "Item Type:")
-            thesis_data.date_deposited = get_table_value_by_header(driver, "Date Deposited:")
-            thesis_data.last_modified = get_table_value_by_header(driver, "Last Modified:")
+            self._extract_thesis_details(page, thesis_data)
             
             return thesis_data
             
@@ -303,25 +382,34 @@ class UNHASScrapingService(IScrapingService):
                 print(f"  - Error processing thesis {index}/{total}: {e}")
             return None
     
-    def _extract_single_thesis_data(self, driver, url: str) -> Dict[str, Any]:
-        """Extract data from a single thesis page (for external use)."""
+    def _extract_single_thesis_data(self, page, url: str) -> Dict[str, Any]:
+        """Extract data from a single parsed thesis page (for external use)."""
         thesis_data = ThesisData("", url, "", "")
         
-        thesis_data.title = get_element_text_or_none(driver, '//*[@id="page-title"]') or ""
-        thesis_data.author = get_element_text_or_none(
-            driver, "/html/body/div[1]/div/div[2]/div/div[4]/p/span"
-        )
-        thesis_data.abstract = get_element_text_or_none(
-            driver, "/html/body/div[1]/div/div[2]/div/div[4]/div[3]/p"
-        )
-        thesis_data.item_type = get_table_value_by_header(driver, "Item Type:")
-        thesis_data.date_deposited = get_table_value_by_header(driver, "Date Deposited:")
-        thesis_data.last_modified = get_table_value_by_header(driver, "Last Modified:")
+        thesis_data.title = get_element_text_or_none(page, _XP_THESIS_TITLE) or ""
+        self._extract_thesis_details(page, thesis_data)
         
         return thesis_data.to_dict()
     
-    def _save_repository_data(self, repository_data: Dict[str, Any], target: ScrapingTarget) -> str:
-        """Save repository data to JSON file."""
+    def _extract_thesis_details(self, page, thesis_data: ThesisData) -> None:
+        """Fill author, abstract and metadata table fields from a parsed thesis page."""
+        thesis_data.author = get_element_text_or_none(page, _XP_THESIS_AUTHOR)
+        thesis_data.abstract = get_element_text_or_none(page, _XP_THESIS_ABSTRACT)
+        
+        # One walk over the header cells serves every metadata field; the
+        # contains-match scan only runs for headers not found verbatim
+        table_values = get_table_values(page)
+        
+        def table_value(header: str) -> Optional[str]:
+            value = table_values.get(normalize_table_header(header))
+            return value if value is not None else get_table_value_by_header(page, header)
+        
+        thesis_data.item_type = table_value("Item Type:")
+        thesis_data.date_deposited = table_value("Date Deposited:")
+        thesis_data.last_modified = table_value("Last Modified:")
+    
+    def _generate_output_path(self, target: ScrapingTarget) -> str:
+        """Generate the output JSON path for a scraping target."""
         from ..core.abstractions import OperationType
         
         # Generate filename
@@ -333,14 +421,26 @@ class UNHASScrapingService(IScrapingService):
         )
         
         # Resolve output path
-        output_file = PathManager.resolve_output_path(self.config.processing.output_dir, filename)
+        return PathManager.resolve_output_path(self.config.processing.output_dir, filename)
+    
+    def _save_repository_data(self, stream_file: str, output_file: str) -> int:
+        """
+        Reshape the JSONL stream into the nested JSON file and remove the stream.
+        
+        Returns:
+            Number of theses saved
+        """
+        repository_data = load_thesis_data(stream_file)
         
-        # Save data
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(repository_data, f, ensure_ascii=False, indent=4)
+        # Save data (gzip-compressed when the output path ends in .gz)
+        payload = dump_json_bytes(repository_data)
+        opener = gzip.open if output_file.endswith('.gz') else open
+        with opener(output_file, 'wb') as f:
+            f.write(payload)
+        os.remove(stream_file)
         
+        total_theses = sum(len(year_data) for year_data in repository_data.values())
         if self.config.verbose_logging:
-            total_theses = sum(len(year_data) for year_data in repository_data.values())
             print(f"\n✅ Scraping complete: {total_theses} theses saved to '{output_file}'")
         
-        return output_file
+        return total_theses